@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserDTO:
     """
     DTO para transferir datos de usuario entre capas.
@@ -18,19 +18,19 @@ class UserDTO:
     created_at: datetime
     updated_at: datetime
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserCreateDTO:
     """DTO para datos de creación de usuario."""
     email: str
     password: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserUpdateDTO:
     """DTO para datos de actualización de usuario."""
     email: Optional[str] = None
     password: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserListDTO:
     """DTO para listado paginado de usuarios."""
     users: List[UserDTO]
@@ -39,7 +39,7 @@ class UserListDTO:
     limit: int
     has_more: bool
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserLoginDTO:
     """DTO para respuesta de login."""
     access_token: str
@@ -49,7 +49,7 @@ class UserLoginDTO:
     email: str
     user: UserDTO
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OperationResultDTO:
     """DTO genérico para resultados de operaciones."""
     success: bool
@@ -2,6 +2,7 @@
 Mappers para conversión entre entidades del dominio y DTOs.
 Mantiene la separación de capas en Clean Architecture.
 """
+from types import SimpleNamespace
 from typing import List, Optional
 from app.domain.user.user_entity import User
 from app.application.dtos.user_dto import (
@@ -10,229 +11,297 @@ from app.application.dtos.user_dto import (
     UserLoginDTO,
     OperationResultDTO
 )
+from app.core.security import create_token_response_data
 from app.interfaces.schemas.user_request import (
     UserCreateRequest,
     UserUpdateRequest
 )
 
-class UserMapper:
-    """
-    Mapper para convertir entre entidades User y DTOs.
-    Centraliza la lógica de conversión y mantiene consistencia.
+def entity_to_dto(user: User) -> UserDTO:
     """
+    Convierte una entidad User del dominio a UserDTO.
     
-    @staticmethod
-    def entity_to_dto(user: User) -> UserDTO:
-        """
-        Convierte una entidad User del dominio a UserDTO.
-        
-        Args:
-            user: Entidad User del dominio
-            
-        Returns:
-            UserDTO serializable
-        """
-        if not user:
-            return None
-            
-        return UserDTO(
-            id=user.id,
-            email=user.email,
-            is_active=user.is_active,
-            created_at=user.created_at,
-            updated_at=user.updated_at
-        )
-    
-    @staticmethod
-    def entities_to_dto_list(users: List[User]) -> List[UserDTO]:
-        """
-        Convierte una lista de entidades User a lista de UserDTO.
+    Args:
+        user: Entidad User del dominio
         
-        Args:
-            users: Lista de entidades User
-            
-        Returns:
-            Lista de UserDTO
-        """
-        if not users:
-            return []
-            
-        return [UserMapper.entity_to_dto(user) for user in users if user]
-    
-    @staticmethod
-    def dto_to_dict(user_dto: UserDTO) -> dict:
-        """
-        Convierte UserDTO a diccionario para respuestas de API.
+    Returns:
+        UserDTO serializable
+    """
+    if not user:
+        return None
         
-        Args:
-            user_dto: DTO del usuario
-            
-        Returns:
-            Diccionario serializable para FastAPI
-        """
-        if not user_dto:
-            return None
-            
-        return {
-            "id": user_dto.id,
-            "email": user_dto.email,
-            "is_active": user_dto.is_active,
-            "created_at": user_dto.created_at.isoformat(),
-            "updated_at": user_dto.updated_at.isoformat()
-        }
+    return UserDTO(
+        id=user.id,
+        email=user.email,
+        is_active=user.is_active,
+        created_at=user.created_at,
+        updated_at=user.updated_at
+    )
+
+def entities_to_dto_list(users: List[User]) -> List[UserDTO]:
+    """
+    Convierte una lista de entidades User a lista de UserDTO.
     
-    @staticmethod
-    def create_user_response(user: User, message: str = "Usuario creado exitosamente") -> dict:
-        """
-        Crea respuesta para creación de usuario.
+    Args:
+        users: Lista de entidades User (el repositorio nunca incluye None)
         
-        Args:
-            user: Entidad User creada
-            message: Mensaje de éxito
-            
-        Returns:
-            Diccionario de respuesta
-        """
-        if not user:
-            return {"user": None, "message": "Error al crear usuario"}
-            
-        user_dto = UserMapper.entity_to_dto(user)
-        return {
-            "user": UserMapper.dto_to_dict(user_dto),
-            "message": message
-        }
+    Returns:
+        Lista de UserDTO
+    """
+    return [entity_to_dto(user) for user in users]
+
+def dto_to_dict(user_dto: UserDTO) -> dict:
+    """
+    Convierte UserDTO a diccionario para respuestas de API.
+    Los datetime se dejan como objetos: UTCORJSONResponse los serializa
+    de forma nativa a ISO 8601 en UTC.
     
-    @staticmethod
-    def create_user_detail_response(user: User, message: str = "Usuario obtenido exitosamente") -> dict:
-        """
-        Crea respuesta para obtener detalles de usuario.
+    Args:
+        user_dto: DTO del usuario
         
-        Args:
-            user: Entidad User
-            message: Mensaje de éxito
-            
-        Returns:
-            Diccionario de respuesta
-        """
-        if not user:
-            return {"user": None, "message": "Usuario no encontrado"}
-            
-        user_dto = UserMapper.entity_to_dto(user)
-        return {
-            "user": UserMapper.dto_to_dict(user_dto),
-            "message": message
-        }
+    Returns:
+        Diccionario serializable para UTCORJSONResponse
+    """
+    if not user_dto:
+        return None
+        
+    return {
+        "id": user_dto.id,
+        "email": user_dto.email,
+        "is_active": user_dto.is_active,
+        "created_at": user_dto.created_at,
+        "updated_at": user_dto.updated_at
+    }
+
+def user_to_response_dict(user: User) -> dict:
+    """
+    Convierte una entidad User directamente al diccionario de respuesta.
+    Evita construir un UserDTO intermedio en respuestas de un solo usuario.
     
-    @staticmethod
-    def create_profile_response(user: User) -> dict:
-        """
-        Crea respuesta para perfil de usuario.
+    Args:
+        user: Entidad User del dominio
         
-        Args:
-            user: Entidad User
-            
-        Returns:
-            Diccionario de respuesta
-        """
-        if not user:
-            return {"user": None, "message": "Perfil no encontrado"}
-            
-        user_dto = UserMapper.entity_to_dto(user)
-        return {
-            "user": UserMapper.dto_to_dict(user_dto),
-            "message": "Perfil obtenido exitosamente"
-        }
+    Returns:
+        Diccionario serializable para UTCORJSONResponse
+    """
+    return {
+        "id": user.id,
+        "email": user.email,
+        "is_active": user.is_active,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at
+    }
+
+def dto_to_dict_str(user_dto: UserDTO) -> dict:
+    """
+    Convierte UserDTO a diccionario con las fechas ya formateadas en ISO.
+    Alternativa a dto_to_dict para consumidores que no serializan con orjson.
     
-    @staticmethod
-    def create_list_response(users: List[User], total: int, skip: int, limit: int) -> dict:
-        """
-        Crea respuesta para listado de usuarios.
+    Args:
+        user_dto: DTO del usuario
         
-        Args:
-            users: Lista de entidades User
-            total: Total de usuarios
-            skip: Registros saltados
-            limit: Límite de registros
-            
-        Returns:
-            Diccionario de respuesta
-        """
-        user_dtos = UserMapper.entities_to_dto_list(users)
-        users_dict = [UserMapper.dto_to_dict(dto) for dto in user_dtos]
-        has_more = skip + len(users) < total
+    Returns:
+        Diccionario serializable con json estándar
+    """
+    if not user_dto:
+        return None
         
-        return {
-            "users": users_dict,
-            "total": total,
-            "skip": skip,
-            "limit": limit,
-            "has_more": has_more
-        }
+    return {
+        "id": user_dto.id,
+        "email": user_dto.email,
+        "is_active": user_dto.is_active,
+        "created_at": user_dto.created_at.isoformat(),
+        "updated_at": user_dto.updated_at.isoformat()
+    }
+
+def create_user_response(user: User, message: str = "Usuario creado exitosamente") -> dict:
+    """
+    Crea respuesta para creación de usuario.
     
-    @staticmethod
-    def create_update_response(user: User, message: str = "Usuario actualizado exitosamente") -> dict:
-        """
-        Crea respuesta para actualización de usuario.
-        
-        Args:
-            user: Entidad User actualizada
-            message: Mensaje de éxito
-            
-        Returns:
-            Diccionario de respuesta
-        """
-        if not user:
-            return {"user": None, "message": "Error al actualizar usuario"}
-            
-        user_dto = UserMapper.entity_to_dto(user)
-        return {
-            "user": UserMapper.dto_to_dict(user_dto),
-            "message": message
-        }
+    Args:
+        user: Entidad User creada
+        message: Mensaje de éxito
     
-    @staticmethod
-    def create_delete_response(user: User, message: str = "Usuario eliminado exitosamente") -> dict:
-        """
-        Crea respuesta para eliminación de usuario.
-        
-        Args:
-            user: Entidad User eliminada
-            message: Mensaje de éxito
-            
-        Returns:
-            Diccionario de respuesta
-        """
-        if not user:
-            return {"message": "Error al eliminar usuario", "deleted_id": None}
-            
-        return {
-            "message": message,
-            "deleted_id": user.id
-        }
+    Returns:
+        Diccionario de respuesta
+    """
+    if not user:
+        return {"user": None, "message": "Error al crear usuario"}
     
-    @staticmethod
-    def create_login_response(token: str, user: User) -> dict:
-        """
-        Crea respuesta para login con token.
-        
-        Args:
-            token: Token JWT
-            user: Entidad User autenticada
-            
-        Returns:
-            Diccionario de respuesta completa
-        """
-        if not user or not token:
-            return {"error": "Error en autenticación"}
-            
-        from app.core.security import create_token_response_data
-        token_data = create_token_response_data(token, user)
-        user_dto = UserMapper.entity_to_dto(user)
-        
-        return {
-            **token_data,
-            "user": UserMapper.dto_to_dict(user_dto)
+    return {
+        "user": user_to_response_dict(user),
+        "message": message
+    }
+
+def create_user_detail_response(user: User, message: str = "Usuario obtenido exitosamente") -> dict:
+    """
+    Crea respuesta para obtener detalles de usuario.
+    
+    Args:
+        user: Entidad User
+        message: Mensaje de éxito
+    
+    Returns:
+        Diccionario de respuesta
+    """
+    if not user:
+        return {"user": None, "message": "Usuario no encontrado"}
+    
+    return {
+        "user": user_to_response_dict(user),
+        "message": message
+    }
+
+def create_profile_response(user: User) -> dict:
+    """
+    Crea respuesta para perfil de usuario.
+    
+    Args:
+        user: Entidad User
+    
+    Returns:
+        Diccionario de respuesta
+    """
+    if not user:
+        return {"user": None, "message": "Perfil no encontrado"}
+    
+    return {
+        "user": user_to_response_dict(user),
+        "message": "Perfil obtenido exitosamente"
+    }
+
+def create_list_response(
+    users: List[User],
+    total: Optional[int],
+    skip: int,
+    limit: int,
+    has_more: Optional[bool] = None
+) -> dict:
+    """
+    Crea respuesta para listado de usuarios.
+    
+    Args:
+        users: Lista de entidades User
+        total: Total de usuarios (None si no se contó)
+        skip: Registros saltados
+        limit: Límite de registros
+        has_more: Si hay más resultados; por defecto se deduce de total
+    
+    Returns:
+        Diccionario de respuesta
+    """
+    # Una sola pasada entidad -> dict, sin UserDTO intermedios
+    users_dict = [
+        {
+            "id": user.id,
+            "email": user.email,
+            "is_active": user.is_active,
+            "created_at": user.created_at,
+            "updated_at": user.updated_at
         }
+        for user in users
+    ]
+    if has_more is None:
+        has_more = total is not None and skip + len(users) < total
+    
+    return {
+        "users": users_dict,
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+        "has_more": has_more
+    }
+
+def create_update_response(user: User, message: str = "Usuario actualizado exitosamente") -> dict:
+    """
+    Crea respuesta para actualización de usuario.
+    
+    Args:
+        user: Entidad User actualizada
+        message: Mensaje de éxito
+    
+    Returns:
+        Diccionario de respuesta
+    """
+    if not user:
+        return {"user": None, "message": "Error al actualizar usuario"}
+    
+    return {
+        "user": user_to_response_dict(user),
+        "message": message
+    }
+
+def create_delete_response(user: User, message: str = "Usuario eliminado exitosamente") -> dict:
+    """
+    Crea respuesta para eliminación de usuario.
+    
+    Args:
+        user: Entidad User eliminada
+        message: Mensaje de éxito
+    
+    Returns:
+        Diccionario de respuesta
+    """
+    if not user:
+        return {"message": "Error al eliminar usuario", "deleted_id": None}
+    
+    return {
+        "message": message,
+        "deleted_id": user.id
+    }
+
+def create_login_response(token: str, user: User) -> dict:
+    """
+    Crea respuesta para login con token.
+    
+    Args:
+        token: Token JWT
+        user: Entidad User autenticada
+    
+    Returns:
+        Diccionario de respuesta completa
+    """
+    if not user or not token:
+        return {"error": "Error en autenticación"}
+    
+    # create_token_response_data devuelve un dict nuevo: se completa en sitio
+    response = create_token_response_data(token, user)
+    response["user"] = user_to_response_dict(user)
+    return response
+
+class UserMapper:
+    """
+    Mapper para convertir entre entidades User y DTOs.
+    Centraliza la lógica de conversión y mantiene consistencia.
+    Compatibilidad: todas las funciones viven a nivel de módulo.
+    """
+    
+    entity_to_dto = staticmethod(entity_to_dto)
+    entities_to_dto_list = staticmethod(entities_to_dto_list)
+    dto_to_dict = staticmethod(dto_to_dict)
+    dto_to_dict_str = staticmethod(dto_to_dict_str)
+    user_to_response_dict = staticmethod(user_to_response_dict)
+    create_user_response = staticmethod(create_user_response)
+    create_user_detail_response = staticmethod(create_user_detail_response)
+    create_profile_response = staticmethod(create_profile_response)
+    create_list_response = staticmethod(create_list_response)
+    create_update_response = staticmethod(create_update_response)
+    create_delete_response = staticmethod(create_delete_response)
+    create_login_response = staticmethod(create_login_response)
 
-# Instancia global del mapper
-user_mapper = UserMapper()
\ No newline at end of file
+# Instancia global del mapper: espacio de nombres con funciones planas,
+# así las llamadas user_mapper.create_*() no pasan por staticmethod
+user_mapper = SimpleNamespace(
+    entity_to_dto=entity_to_dto,
+    entities_to_dto_list=entities_to_dto_list,
+    dto_to_dict=dto_to_dict,
+    dto_to_dict_str=dto_to_dict_str,
+    user_to_response_dict=user_to_response_dict,
+    create_user_response=create_user_response,
+    create_user_detail_response=create_user_detail_response,
+    create_profile_response=create_profile_response,
+    create_list_response=create_list_response,
+    create_update_response=create_update_response,
+    create_delete_response=create_delete_response,
+    create_login_response=create_login_response
+)
\ No newline at end of file
@@ -2,6 +2,14 @@
 Controller de usuarios corregido con DTOs y mappers.
 Mantiene la separación de capas según Clean Architecture.
 """
+import logging
+from typing import AsyncIterator
+import orjson
+from fastapi import Response, status
+from fastapi.responses import StreamingResponse
+from app.core.cache import profile_response_cache
+from app.core.responses import ORJSON_OPTIONS, UTCORJSONResponse
+from app.domain.user.user_entity import User
 from app.use_cases.user.create_user import create_user_use_case
 from app.use_cases.user.login_user import login_user_use_case
 from app.use_cases.user.get_user_by_id import get_user_by_id_use_case
@@ -16,6 +24,8 @@ from app.interfaces.schemas.user_request import (
 )
 from app.application.mappers.user_mapper import user_mapper
 
+logger = logging.getLogger(__name__)
+
 class UserController:
     """
     Controller corregido que usa DTOs y mappers para mantener
@@ -31,7 +41,7 @@ class UserController:
         self.delete_user_use_case = delete_user_use_case
         self.user_mapper = user_mapper
 
-    async def create_user(self, request: UserCreateRequest) -> dict:
+    async def create_user(self, request: UserCreateRequest) -> UTCORJSONResponse:
         """
         Crea un nuevo usuario.
         
@@ -39,12 +49,15 @@ class UserController:
             request: Datos del usuario a crear
             
         Returns:
-            Diccionario con información del usuario creado
+            UTCORJSONResponse con información del usuario creado
         """
         user = await self.create_user_use_case.execute(request.email, request.password)
-        return self.user_mapper.create_user_response(user)
+        return UTCORJSONResponse(
+            content=self.user_mapper.create_user_response(user),
+            status_code=status.HTTP_201_CREATED
+        )
 
-    async def login_user(self, request: UserLoginRequest) -> dict:
+    async def login_user(self, request: UserLoginRequest) -> UTCORJSONResponse:
         """
         Autentica un usuario y genera token JWT.
         
@@ -52,12 +65,12 @@ class UserController:
             request: Credenciales de login
             
         Returns:
-            Diccionario con token y datos del usuario
+            UTCORJSONResponse con token y datos del usuario
         """
         token, user = await self.login_user_use_case.execute(request.email, request.password)
-        return self.user_mapper.create_login_response(token, user)
+        return UTCORJSONResponse(content=self.user_mapper.create_login_response(token, user))
 
-    async def get_user_by_id(self, user_id: str, current_user) -> dict:
+    async def get_user_by_id(self, user_id: str, current_user) -> UTCORJSONResponse:
         """
         Obtiene un usuario por ID.
         
@@ -66,31 +79,37 @@ class UserController:
             current_user: Usuario autenticado
             
         Returns:
-            Diccionario con información del usuario
+            UTCORJSONResponse con información del usuario
         """
-        print(f"🎮 CONTROLLER: get_user_by_id llamado con ID: {user_id}")
-        print(f"🔐 CONTROLLER: requesting_user_id: {current_user.id}")
+        logger.debug("CONTROLLER: get_user_by_id id=%s requesting_user_id=%s", user_id, current_user.id)
 
         user = await self.get_user_by_id_use_case.execute(user_id, current_user.id)
-        print(f"✅ CONTROLLER: Usuario encontrado: {user.id} - {user.email}")
+        logger.debug("CONTROLLER: usuario encontrado id=%s email=%s", user.id, user.email)
         
         # 🔧 FIX: Convertir entidad a diccionario usando mapper
-        return self.user_mapper.create_user_detail_response(user)
+        return UTCORJSONResponse(content=self.user_mapper.create_user_detail_response(user))
 
-    async def get_current_user_profile(self, current_user) -> dict:
+    async def get_current_user_profile(self, current_user) -> Response:
         """
         Obtiene el perfil del usuario autenticado.
+        El JSON se guarda ya serializado por ID de usuario; UserModel lo
+        invalida al actualizar o eliminar el usuario.
         
         Args:
             current_user: Usuario autenticado
             
         Returns:
-            Diccionario con perfil del usuario
-        """
-        user = await self.get_user_by_id_use_case.execute_own_profile(current_user.id)
-        return self.user_mapper.create_profile_response(user)
+            Response JSON con perfil del usuario
+        """
+        body = profile_response_cache.get(current_user.id)
+        if body is None:
+            generation = profile_response_cache.generation(current_user.id)
+            user = await self.get_user_by_id_use_case.execute_own_profile(current_user.id)
+            body = orjson.dumps(self.user_mapper.create_profile_response(user), option=ORJSON_OPTIONS)
+            profile_response_cache.set_if_unchanged(current_user.id, body, generation)
+        return Response(content=body, media_type="application/json")
 
-    async def list_users(self, query: UserQueryRequest, current_user) -> dict:
+    async def list_users(self, query: UserQueryRequest, current_user) -> UTCORJSONResponse:
         """
         Lista usuarios con paginación.
         
@@ -99,16 +118,47 @@ class UserController:
             current_user: Usuario autenticado que hace la petición
             
         Returns:
-            Diccionario con lista de usuarios y metadatos de paginación
+            UTCORJSONResponse con lista de usuarios y metadatos de paginación
+        """
+        users, has_more = await self.list_users_use_case.execute(
+            requesting_user_id=current_user.id,
+            skip=query.skip,
+            limit=query.limit
+        )
+        return UTCORJSONResponse(
+            content=self.user_mapper.create_list_response(users, None, query.skip, query.limit, has_more)
+        )
+
+    async def stream_users(self, query: UserQueryRequest, current_user) -> StreamingResponse:
+        """
+        Lista usuarios como NDJSON (un objeto JSON por línea).
+        
+        Args:
+            query: Parámetros de consulta (skip, limit)
+            current_user: Usuario autenticado que hace la petición
+            
+        Returns:
+            StreamingResponse que envía cada usuario al leerlo del cursor
         """
-        users, total = await self.list_users_use_case.execute(
+        users = await self.list_users_use_case.stream(
             requesting_user_id=current_user.id,
             skip=query.skip,
             limit=query.limit
         )
-        return self.user_mapper.create_list_response(users, total, query.skip, query.limit)
+        # Content-Encoding explícito: GZipMiddleware deja pasar el cuerpo tal cual.
+        # Si lo comprimiera, retendría cada línea en el buffer gzip hasta el final
+        return StreamingResponse(
+            self._ndjson_lines(users),
+            media_type="application/x-ndjson",
+            headers={"Content-Encoding": "identity"}
+        )
+    
+    def _ndjson_lines(self, users: AsyncIterator[User]) -> AsyncIterator[bytes]:
+        """Serializa cada usuario como una línea NDJSON."""
+        to_dict = self.user_mapper.user_to_response_dict
+        return (orjson.dumps(to_dict(user), option=ORJSON_OPTIONS) + b"\n" async for user in users)
 
-    async def update_user(self, user_id: str, request: UserUpdateRequest, current_user) -> dict:
+    async def update_user(self, user_id: str, request: UserUpdateRequest, current_user) -> UTCORJSONResponse:
         """
         Actualiza un usuario existente.
         
@@ -118,7 +168,7 @@ class UserController:
             current_user: Usuario autenticado que hace la petición
             
         Returns:
-            Diccionario con información del usuario actualizado
+            UTCORJSONResponse con información del usuario actualizado
         """
         user = await self.update_user_use_case.execute(
             user_id=user_id,
@@ -126,9 +176,9 @@ class UserController:
             new_email=request.email,
             new_password=request.password
         )
-        return self.user_mapper.create_update_response(user)
+        return UTCORJSONResponse(content=self.user_mapper.create_update_response(user))
 
-    async def delete_user_soft(self, user_id: str, current_user) -> dict:
+    async def delete_user_soft(self, user_id: str, current_user) -> UTCORJSONResponse:
         """
         Elimina un usuario (soft delete).
         
@@ -137,12 +187,12 @@ class UserController:
             current_user: Usuario autenticado que hace la petición
             
         Returns:
-            Diccionario con confirmación de eliminación
+            UTCORJSONResponse con confirmación de eliminación
         """
         user = await self.delete_user_use_case.execute_soft_delete(user_id, current_user.id)
-        return self.user_mapper.create_delete_response(user, "Usuario desactivado exitosamente")
+        return UTCORJSONResponse(content=self.user_mapper.create_delete_response(user, "Usuario desactivado exitosamente"))
 
-    async def delete_user_hard(self, user_id: str, current_user) -> dict:
+    async def delete_user_hard(self, user_id: str, current_user) -> UTCORJSONResponse:
         """
         Elimina un usuario permanentemente (hard delete).
         
@@ -151,12 +201,14 @@ class UserController:
             current_user: Usuario autenticado que hace la petición
             
         Returns:
-            Diccionario con confirmación de eliminación
+            UTCORJSONResponse con confirmación de eliminación
         """
         deleted_id = await self.delete_user_use_case.execute_hard_delete(user_id, current_user.id)
-        return {"message": "Usuario eliminado permanentemente", "deleted_id": deleted_id}
+        return UTCORJSONResponse(
+            content={"message": "Usuario eliminado permanentemente", "deleted_id": deleted_id}
+        )
 
-    async def reactivate_user(self, user_id: str, current_user) -> dict:
+    async def reactivate_user(self, user_id: str, current_user) -> UTCORJSONResponse:
         """
         Reactiva un usuario desactivado.
         
@@ -165,10 +217,10 @@ class UserController:
             current_user: Usuario autenticado que hace la petición
             
         Returns:
-            Diccionario con información del usuario reactivado
+            UTCORJSONResponse con información del usuario reactivado
         """
         user = await self.delete_user_use_case.reactivate_user(user_id, current_user.id)
-        return self.user_mapper.create_update_response(user, "Usuario reactivado exitosamente")
+        return UTCORJSONResponse(content=self.user_mapper.create_update_response(user, "Usuario reactivado exitosamente"))
 
 # Instancia global
 user_controller = UserController()
\ No newline at end of file
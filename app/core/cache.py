@@ -0,0 +1,131 @@
+"""
+Cache en memoria con expiración por tiempo.
+Usada para evitar consultas repetidas en rutas calientes (p. ej. autenticación).
+"""
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+import time
+
+class TTLCache:
+    """
+    Cache LRU acotada en tamaño con expiración (TTL) por entrada.
+    Pensada para el event loop de un solo proceso: no usa locks.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize: Número máximo de entradas antes de descartar la menos usada
+            ttl: Segundos de vida por defecto de cada entrada
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        # Generación de invalidación por clave: permite descartar valores leídos
+        # antes de una invalidación que ocurrió mientras se cargaban
+        self._generations: Dict[Hashable, int] = {}
+        self._generation_seq = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Obtiene un valor si existe y no ha expirado.
+        
+        Args:
+            key: Clave a buscar
+            default: Valor a retornar si no hay entrada válida
+            
+        Returns:
+            Valor cacheado o default
+        """
+        item = self._data.get(key)
+        if item is None:
+            return default
+        
+        value, expires_at = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Guarda un valor con el TTL de la cache o uno propio de la entrada.
+        
+        Args:
+            key: Clave de la entrada
+            value: Valor a guardar
+            ttl: Segundos de vida de esta entrada (por defecto, el TTL de la cache)
+        """
+        if ttl is None:
+            ttl = self.ttl
+        self._data[key] = (value, time.monotonic() + ttl)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable) -> None:
+        """Elimina una entrada si existe."""
+        self._data.pop(key, None)
+    
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Elimina una entrada y avanza su generación de invalidación.
+        Las cargas iniciadas antes ya no podrán guardar su valor (ver set_if_unchanged).
+        
+        Args:
+            key: Clave invalidada
+        """
+        self._data.pop(key, None)
+        self._generation_seq += 1
+        # Reinsertar al final: el dict queda ordenado por antigüedad de la invalidación
+        self._generations.pop(key, None)
+        self._generations[key] = self._generation_seq
+        if len(self._generations) > self.maxsize:
+            # Las invalidaciones más antiguas ya no afectan a ninguna carga en curso
+            del self._generations[next(iter(self._generations))]
+    
+    def generation(self, key: Hashable) -> int:
+        """
+        Retorna la generación de invalidación actual de una clave.
+        
+        Args:
+            key: Clave a consultar
+            
+        Returns:
+            Marca a pasar a set_if_unchanged tras cargar el valor
+        """
+        return self._generations.get(key, 0)
+    
+    def set_if_unchanged(self, key: Hashable, value: Any, generation: int) -> bool:
+        """
+        Guarda un valor solo si la clave no se invalidó desde que se leyó su generación.
+        
+        Args:
+            key: Clave de la entrada
+            value: Valor cargado
+            generation: Resultado de generation(key) antes de iniciar la carga
+            
+        Returns:
+            True si se guardó, False si el valor quedó obsoleto
+        """
+        if self._generations.get(key, 0) != generation:
+            return False
+        self.set(key, value)
+        return True
+    
+    def clear(self) -> None:
+        """Vacía la cache."""
+        self._data.clear()
+        self._generations.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+# Instancia global: usuarios autenticados por ID (invalidada en cada escritura)
+current_user_cache = TTLCache(maxsize=10_000, ttl=30)
+
+
+# Instancia global: respuestas de /me/profile ya serializadas, por ID de usuario
+profile_response_cache = TTLCache(maxsize=10_000, ttl=60)
\ No newline at end of file
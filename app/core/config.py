@@ -2,16 +2,26 @@
 Configuración central de la aplicación.
 Maneja variables de entorno y configuraciones generales.
 """
+from functools import cached_property, lru_cache
 from typing import Optional
-import os
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-class Settings:
-    """Configuraciones de la aplicación."""
+class Settings(BaseSettings):
+    """
+    Configuraciones de la aplicación.
+    Los valores se leen y validan desde variables de entorno una sola vez.
+    """
+    
+    model_config = SettingsConfigDict(frozen=True, extra="ignore")
     
     # JWT Configuration
-    JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production-please-use-32-chars-minimum")
+    JWT_SECRET_KEY: str = "your-secret-key-change-in-production-please-use-32-chars-minimum"
     JWT_ALGORITHM: str = "HS256"
-    JWT_EXPIRATION_TIME_MINUTES: int = int(os.getenv("JWT_EXPIRATION_TIME_MINUTES", "30"))
+    JWT_EXPIRATION_TIME_MINUTES: int = 30
+    
+    # Password hashing: factor de coste de bcrypt (2^cost iteraciones, cada -1 reduce el tiempo a la mitad)
+    BCRYPT_COST: int = Field(default=10, ge=4, le=31)
     
     # API Configuration
     API_V1_PREFIX: str = "/api/v1"
@@ -19,23 +29,47 @@ class Settings:
     PROJECT_VERSION: str = "1.0.0"
     
     # CORS Configuration
-    ALLOWED_ORIGINS: list = ["*"]  # En producción, especificar dominios exactos
+    ALLOWED_ORIGINS: tuple = ("*",)  # En producción, especificar dominios exactos
     
     # ✅ MEJORADO: MongoDB Configuration con mejor manejo de errores
-    MONGODB_URL: str = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
-    DATABASE_NAME: str = os.getenv("DATABASE_NAME", "clients_db")
-    USERS_COLLECTION: str = os.getenv("USERS_COLLECTION", "users")
+    MONGODB_URL: str = "mongodb://localhost:27017"
+    DATABASE_NAME: str = "clients_db"
+    USERS_COLLECTION: str = "users"
     
     # Environment
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
-    DEBUG: bool = ENVIRONMENT == "development"
+    ENVIRONMENT: str = "development"
     
-    # ✅ AGREGADO: Configuración de logging
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO" if ENVIRONMENT == "production" else "DEBUG")
+    # ✅ AGREGADO: Configuración de logging (por defecto según ENVIRONMENT)
+    LOG_LEVEL: Optional[str] = Field(default=None, validate_default=True)
     
     # ✅ AGREGADO: Configuración de timeouts
-    DB_CONNECTION_TIMEOUT: int = int(os.getenv("DB_CONNECTION_TIMEOUT", "10"))
-    DB_SERVER_SELECTION_TIMEOUT: int = int(os.getenv("DB_SERVER_SELECTION_TIMEOUT", "5"))
+    DB_CONNECTION_TIMEOUT: int = 10
+    DB_SERVER_SELECTION_TIMEOUT: int = 5
+    
+    # Pool de conexiones de MongoDB
+    DB_MAX_POOL_SIZE: int = 50
+    DB_MIN_POOL_SIZE: int = 5
+    DB_MAX_IDLE_TIME_MS: int = 300_000
+    DB_MAX_CONNECTING: int = 4
+    DB_WAIT_QUEUE_TIMEOUT_MS: int = 2000
+    
+    @field_validator("LOG_LEVEL")
+    @classmethod
+    def _default_log_level(cls, v: Optional[str], info) -> str:
+        """Usa INFO en producción y DEBUG en el resto si no se define LOG_LEVEL."""
+        if v:
+            return v
+        return "INFO" if info.data.get("ENVIRONMENT") == "production" else "DEBUG"
+    
+    @property
+    def DEBUG(self) -> bool:
+        """Modo debug activo solo en desarrollo."""
+        return self.ENVIRONMENT == "development"
+    
+    @cached_property
+    def JWT_SECRET_KEY_BYTES(self) -> bytes:
+        """Clave JWT ya codificada para firmar/verificar sin re-encodear."""
+        return self.JWT_SECRET_KEY.encode("utf-8")
     
     def get_mongodb_url(self) -> str:
         """
@@ -55,8 +89,19 @@ class Settings:
         if not self.DATABASE_NAME:
             raise ValueError("DATABASE_NAME is required")
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Obtiene la configuración de la aplicación.
+    El entorno se lee una sola vez y la instancia se reutiliza.
+    
+    Returns:
+        Instancia única de Settings
+    """
+    return Settings()
+
 # Instancia global de configuración
-settings = Settings()
+settings = get_settings()
 
 # ✅ AGREGADO: Validar configuración al importar en producción
 if settings.ENVIRONMENT == "production":
@@ -64,4 +109,4 @@ if settings.ENVIRONMENT == "production":
         settings.validate_settings()
     except ValueError as e:
         print(f"❌ Configuration error: {e}")
-        raise
\ No newline at end of file
+        raise
@@ -3,11 +3,11 @@ Manejadores de excepciones centralizados.
 Convierte excepciones del dominio en respuestas HTTP apropiadas.
 """
 from fastapi import Request, HTTPException, status
-from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 import logging
-from datetime import datetime
+from app.core.responses import UTCORJSONResponse
+from app.core.utils import date_utils
 from app.core.exceptions import (
     DomainException,
     ValidationException,
@@ -28,6 +28,9 @@ from app.core.exceptions import (
 # Configurar logger
 logger = logging.getLogger(__name__)
 
+# Header estándar para respuestas 401 (compartido, no se modifica)
+_AUTH_HEADERS = {"WWW-Authenticate": "Bearer"}
+
 class ExceptionHandler:
     """Manejador centralizado de excepciones."""
     
@@ -37,8 +40,9 @@ class ExceptionHandler:
         message: str,
         error_code: str = None,
         details: dict = None,
-        path: str = None
-    ) -> JSONResponse:
+        path: str = None,
+        headers: dict = None
+    ) -> UTCORJSONResponse:
         """
         Crea una respuesta de error estándar.
         
@@ -48,15 +52,16 @@ class ExceptionHandler:
             error_code: Código de error interno
             details: Detalles adicionales del error
             path: Ruta donde ocurrió el error
+            headers: Headers HTTP adicionales de la respuesta
             
         Returns:
-            JSONResponse con formato estándar de error
+            UTCORJSONResponse con formato estándar de error
         """
         error_data = {
             "error": True,
             "message": message,
             "status_code": status_code,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": date_utils.get_current_utc_iso(),
         }
         
         if error_code:
@@ -68,9 +73,10 @@ class ExceptionHandler:
         if path:
             error_data["path"] = path
         
-        return JSONResponse(
+        return UTCORJSONResponse(
             status_code=status_code,
-            content=error_data
+            content=error_data,
+            headers=headers
         )
 
 # Manejadores específicos para cada tipo de excepción
@@ -82,7 +88,7 @@ async def domain_exception_handler(request: Request, exc: DomainException):
         status_code=status.HTTP_400_BAD_REQUEST,
         message=exc.message,
         error_code=exc.error_code,
-        path=str(request.url)
+        path=request.scope["path"]
     )
 
 async def validation_exception_handler(request: Request, exc: ValidationException):
@@ -98,24 +104,20 @@ async def validation_exception_handler(request: Request, exc: ValidationExceptio
         message=exc.message,
         error_code=exc.error_code,
         details=details if details else None,
-        path=str(request.url)
+        path=request.scope["path"]
     )
 
 async def authentication_exception_handler(request: Request, exc: AuthenticationException):
     """Manejador para errores de autenticación."""
     logger.info(f"Authentication error: {exc.message}")
     
-    headers = {"WWW-Authenticate": "Bearer"}
-    
-    response = ExceptionHandler.create_error_response(
+    return ExceptionHandler.create_error_response(
         status_code=status.HTTP_401_UNAUTHORIZED,
         message=exc.message,
         error_code=exc.error_code,
-        path=str(request.url)
+        path=request.scope["path"],
+        headers=_AUTH_HEADERS
     )
-    
-    response.headers.update(headers)
-    return response
 
 async def authorization_exception_handler(request: Request, exc: AuthorizationException):
     """Manejador para errores de autorización."""
@@ -125,7 +127,7 @@ async def authorization_exception_handler(request: Request, exc: AuthorizationEx
         status_code=status.HTTP_403_FORBIDDEN,
         message=exc.message,
         error_code=exc.error_code,
-        path=str(request.url)
+        path=request.scope["path"]
     )
 
 async def not_found_exception_handler(request: Request, exc: NotFoundException):
@@ -143,7 +145,7 @@ async def not_found_exception_handler(request: Request, exc: NotFoundException):
         message=exc.message,
         error_code=exc.error_code,
         details=details if details else None,
-        path=str(request.url)
+        path=request.scope["path"]
     )
 
 async def conflict_exception_handler(request: Request, exc: ConflictException):
@@ -159,7 +161,7 @@ async def conflict_exception_handler(request: Request, exc: ConflictException):
         message=exc.message,
         error_code=exc.error_code,
         details=details if details else None,
-        path=str(request.url)
+        path=request.scope["path"]
     )
 
 async def business_rule_exception_handler(request: Request, exc: BusinessRuleException):
@@ -175,7 +177,7 @@ async def business_rule_exception_handler(request: Request, exc: BusinessRuleExc
         message=exc.message,
         error_code=exc.error_code,
         details=details if details else None,
-        path=str(request.url)
+        path=request.scope["path"]
     )
 
 async def infrastructure_exception_handler(request: Request, exc: InfrastructureException):
@@ -191,7 +193,7 @@ async def infrastructure_exception_handler(request: Request, exc: Infrastructure
         message="Error interno del sistema",  # No exponer detalles internos
         error_code=exc.error_code,
         details=details if details else None,
-        path=str(request.url)
+        path=request.scope["path"]
     )
 
 # Manejadores para excepciones estándar de FastAPI
@@ -202,29 +204,31 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     return ExceptionHandler.create_error_response(
         status_code=exc.status_code,
         message=exc.detail,
-        path=str(request.url)
+        path=request.scope["path"]
     )
 
 async def request_validation_exception_handler(request: Request, exc: RequestValidationError):
     """Manejador para errores de validación de requests."""
-    logger.info(f"Request validation error: {exc.errors()}")
+    # exc.errors() re-serializa los errores de Pydantic en cada llamada
+    raw_errors = exc.errors()
+    logger.info(f"Request validation error: {raw_errors}")
     
     # Formatear errores de validación de Pydantic
-    errors = []
-    for error in exc.errors():
-        field = " -> ".join(str(loc) for loc in error["loc"])
-        errors.append({
-            "field": field,
+    errors = [
+        {
+            "field": " -> ".join(map(str, error["loc"])),
             "message": error["msg"],
             "type": error["type"]
-        })
+        }
+        for error in raw_errors
+    ]
     
     return ExceptionHandler.create_error_response(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         message="Datos de entrada inválidos",
         error_code="VALIDATION_ERROR",
         details={"validation_errors": errors},
-        path=str(request.url)
+        path=request.scope["path"]
     )
 
 async def general_exception_handler(request: Request, exc: Exception):
@@ -235,7 +239,7 @@ async def general_exception_handler(request: Request, exc: Exception):
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         message="Error interno del servidor",
         error_code="INTERNAL_ERROR",
-        path=str(request.url)
+        path=request.scope["path"]
     )
 
 # Diccionario con todos los manejadores
@@ -264,4 +268,34 @@ EXCEPTION_HANDLERS = {
     
     # Excepción general
     Exception: general_exception_handler,
-}
\ No newline at end of file
+}
+
+def _expand_to_subclasses(handlers: dict) -> dict:
+    """
+    Registra cada subclase de las excepciones del dominio por su clase concreta.
+    Starlette resuelve el handler con una búsqueda por type(exc) y solo recorre
+    el MRO si no hay coincidencia exacta; así toda excepción del dominio se
+    resuelve en la primera búsqueda.
+    
+    Args:
+        handlers: Mapeo base {tipo de excepción: handler}
+        
+    Returns:
+        Nuevo mapeo que incluye todas las subclases del dominio
+    """
+    expanded = dict(handlers)
+    pending = [DomainException]
+    while pending:
+        exc_class = pending.pop()
+        for subclass in exc_class.__subclasses__():
+            if subclass not in expanded:
+                # Hereda el handler del ancestro registrado más cercano
+                for base in subclass.__mro__[1:]:
+                    if base in expanded:
+                        expanded[subclass] = expanded[base]
+                        break
+            pending.append(subclass)
+    return expanded
+
+# Mapeo final con clases concretas, calculado una sola vez al importar
+EXCEPTION_HANDLERS = _expand_to_subclasses(EXCEPTION_HANDLERS)
@@ -0,0 +1,105 @@
+"""
+Middlewares ASGI de la aplicación.
+Implementados directamente sobre la interfaz ASGI (scope, receive, send),
+sin BaseHTTPMiddleware, para no crear tareas ni streams adicionales por request.
+"""
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("app.main")
+
+# Clave del scope donde JWTAuthMiddleware deja el payload verificado (o None)
+AUTH_PAYLOAD_KEY = "auth_payload"
+
+
+class RequestLoggingMiddleware:
+    """Middleware ASGI para logging de todas las requests HTTP."""
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Registra la request entrante y el status/tiempo de la respuesta.
+        
+        Args:
+            scope: Scope ASGI de la conexión
+            receive: Canal de recepción ASGI
+            send: Canal de envío ASGI
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+        query_string = scope["query_string"]
+        if query_string:
+            path = f"{path}?{query_string.decode('latin-1')}"
+        status_code = 500
+        
+        # Log request
+        logger.info("📥 %s %s", method, path)
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Log response
+            process_time = time.perf_counter() - start_time
+            logger.info("📤 %s %s - %s - %.4fs", method, path, status_code, process_time)
+
+
+class JWTAuthMiddleware:
+    """
+    Middleware ASGI que verifica el Bearer token una vez por request.
+    Deja el payload en scope[AUTH_PAYLOAD_KEY] sin construir Request ni consultar la BD.
+    """
+    
+    def __init__(self, app: ASGIApp, verify_fn: Callable[[str], Optional[Dict[str, Any]]]):
+        """
+        Args:
+            app: Aplicación ASGI envuelta
+            verify_fn: Función síncrona que verifica un token y retorna su payload o None
+        """
+        self.app = app
+        self.verify_fn = verify_fn
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Verifica el header Authorization (si existe) y continúa con la request.
+        
+        Args:
+            scope: Scope ASGI de la conexión
+            receive: Canal de recepción ASGI
+            send: Canal de envío ASGI
+        """
+        if scope["type"] == "http":
+            scope[AUTH_PAYLOAD_KEY] = self._verify_headers(scope["headers"])
+        await self.app(scope, receive, send)
+    
+    def _verify_headers(self, headers: list) -> Optional[Dict[str, Any]]:
+        """
+        Busca el header Authorization y verifica su Bearer token.
+        
+        Args:
+            headers: Headers ASGI como lista de tuplas (bytes, bytes)
+            
+        Returns:
+            Payload del token si es válido, None en caso contrario
+        """
+        for name, value in headers:
+            if name == b"authorization":
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                if scheme.lower() == "bearer" and token:
+                    return self.verify_fn(token)
+                return None
+        return None
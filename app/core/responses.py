@@ -0,0 +1,20 @@
+"""
+Clases de respuesta HTTP de la aplicación.
+Serializa con orjson tratando los datetime naive como UTC.
+"""
+from typing import Any
+import orjson
+from fastapi.responses import ORJSONResponse
+
+# Opciones de serialización compartidas por todas las respuestas JSON
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+class UTCORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse que serializa los datetime naive como UTC.
+    Las entidades guardan fechas con datetime.utcnow(), por lo que orjson
+    puede formatearlas en C sin llamar a isoformat() por cada campo.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
@@ -2,12 +2,15 @@
 Configuración de seguridad y autenticación JWT.
 Maneja la verificación de tokens y dependencias de autenticación.
 """
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional
+from typing import Annotated, Optional
 from app.infrastructure.auth.jwt_handler import jwt_handler
 from app.infrastructure.db.user_model import user_model
 from app.domain.user.user_entity import User
+from app.core.config import settings
+from app.core.cache import current_user_cache, profile_response_cache
+from app.core.middleware import AUTH_PAYLOAD_KEY
 
 # Esquema de seguridad Bearer Token
 security = HTTPBearer()
@@ -17,12 +20,14 @@ class SecurityService:
     
     @staticmethod
     async def get_current_user(
+        request: Request,
         credentials: HTTPAuthorizationCredentials = Depends(security)
     ) -> User:
         """
         Dependency para obtener el usuario actual autenticado.
         
         Args:
+            request: Request actual (su scope trae el payload de JWTAuthMiddleware)
             credentials: Credenciales JWT del header Authorization
             
         Returns:
@@ -38,8 +43,12 @@ class SecurityService:
         )
         
         try:
-            # Verificar y decodificar token
-            payload = jwt_handler.verify_token(credentials.credentials)
+            # Payload ya verificado por JWTAuthMiddleware; si no está instalado, verificar aquí
+            scope = request.scope
+            if AUTH_PAYLOAD_KEY in scope:
+                payload = scope[AUTH_PAYLOAD_KEY]
+            else:
+                payload = jwt_handler.verify_token(credentials.credentials)
             if payload is None:
                 raise credentials_exception
             
@@ -50,8 +59,8 @@ class SecurityService:
         except Exception:
             raise credentials_exception
         
-        # Buscar usuario en la base de datos
-        user = await user_model.get_by_id(user_id)
+        # Buscar usuario (cache con TTL, luego base de datos)
+        user = await SecurityService.get_user_by_id_cached(user_id)
         if user is None:
             raise credentials_exception
         
@@ -70,24 +79,42 @@ class SecurityService:
     ) -> User:
         """
         Dependency para obtener el usuario actual activo.
-        Es un wrapper adicional para mayor claridad en los endpoints.
+        get_current_user ya rechaza usuarios inactivos, así que solo
+        se mantiene por compatibilidad.
         
         Args:
             current_user: Usuario actual obtenido del token
             
         Returns:
             Entidad User del usuario activo
-            
-        Raises:
-            HTTPException: Si el usuario está inactivo
         """
-        if not current_user.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Inactive user"
-            )
         return current_user
     
+    @staticmethod
+    async def get_user_by_id_cached(user_id: str) -> Optional[User]:
+        """
+        Obtiene un usuario por ID usando la cache en memoria con TTL.
+        UserModel.get_by_id consulta y rellena current_user_cache.
+        
+        Args:
+            user_id: ID del usuario
+            
+        Returns:
+            Entidad User si existe, None en caso contrario
+        """
+        return await user_model.get_by_id(user_id)
+    
+    @staticmethod
+    def invalidate_user(user_id: str) -> None:
+        """
+        Descarta el usuario cacheado para forzar una nueva lectura.
+        
+        Args:
+            user_id: ID del usuario modificado
+        """
+        current_user_cache.invalidate(user_id)
+        profile_response_cache.invalidate(user_id)
+    
     @staticmethod
     def verify_token_without_exception(token: str) -> Optional[dict]:
         """
@@ -121,7 +148,7 @@ class SecurityService:
         if not user_id:
             return None
         
-        user = await user_model.get_by_id(user_id)
+        user = await SecurityService.get_user_by_id_cached(user_id)
         if not user or not user.is_active:
             return None
         
@@ -132,16 +159,18 @@ security_service = SecurityService()
 
 # Función de conveniencia para dependency injection
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> User:
     """Dependency function para obtener el usuario actual."""
-    return await security_service.get_current_user(credentials)
+    return await security_service.get_current_user(request, credentials)
 
-async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
-    """Dependency function para obtener el usuario actual activo."""
-    return await security_service.get_current_active_user(current_user)
+# get_current_user ya verifica que el usuario esté activo: se expone la misma
+# dependency para que FastAPI resuelva un solo nivel por request
+get_current_active_user = get_current_user
+
+# Tipo anotado para inyectar el usuario autenticado en las rutas
+CurrentUser = Annotated[User, Depends(get_current_active_user)]
 
 # Funciones adicionales de utilidad
 def create_token_response_data(token: str, user: User) -> dict:
@@ -155,8 +184,6 @@ def create_token_response_data(token: str, user: User) -> dict:
     Returns:
         Diccionario con datos del token y usuario
     """
-    from app.core.config import settings
-    
     return {
         "access_token": token,
         "token_type": "bearer",
@@ -2,11 +2,23 @@
 Funciones auxiliares generales.
 Funciones de utilidad que se usan en toda la aplicación.
 """
+import os
 import re
+import time
 from datetime import datetime
 from typing import Any, Dict, Optional
 import uuid
 
+# Patrón de email compilado una sola vez; TLD acotado a 63 caracteres (límite DNS)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,63}$')
+
+# Formato canónico de UUID (8-4-4-4-12 hexadecimal)
+_UUID_RE = re.compile(r'\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z')
+
+# Cache del timestamp ISO con resolución de segundos (ver DateUtils.get_current_utc_iso)
+_cached_iso_second = 0
+_cached_iso_timestamp = ""
+
 class ValidationUtils:
     """Utilidades para validación de datos."""
     
@@ -24,8 +36,7 @@ class ValidationUtils:
         if not email:
             return False
         
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(email_pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
     
     @staticmethod
     def is_valid_password(password: str) -> bool:
@@ -44,16 +55,21 @@ class ValidationUtils:
         return len(password) >= 6 and len(password) <= 128
     
     @staticmethod
-    def is_valid_uuid(uuid_string: str) -> bool:
+    def is_valid_uuid(uuid_string: str, strict: bool = False) -> bool:
         """
         Valida si un string es un UUID válido.
         
         Args:
             uuid_string: String a validar
+            strict: Si True, parsea con uuid.UUID (acepta también otras
+                representaciones como hex sin guiones o llaves)
             
         Returns:
             True si es un UUID válido, False en caso contrario
         """
+        if not strict:
+            return isinstance(uuid_string, str) and _UUID_RE.match(uuid_string) is not None
+        
         try:
             uuid.UUID(uuid_string)
             return True
@@ -73,6 +89,23 @@ class DateUtils:
         """
         return datetime.utcnow()
     
+    @staticmethod
+    def get_current_utc_iso() -> str:
+        """
+        Obtiene el instante actual en UTC como string ISO con resolución de segundos.
+        El string se formatea una sola vez por segundo y se reutiliza.
+        
+        Returns:
+            String ISO en UTC terminado en 'Z'
+        """
+        global _cached_iso_second, _cached_iso_timestamp
+        
+        now = int(time.time())
+        if now != _cached_iso_second:
+            _cached_iso_timestamp = datetime.utcfromtimestamp(now).isoformat() + "Z"
+            _cached_iso_second = now
+        return _cached_iso_timestamp
+    
     @staticmethod
     def format_datetime(dt: datetime) -> str:
         """
@@ -87,16 +120,25 @@ class DateUtils:
         return dt.isoformat()
     
     @staticmethod
-    def parse_datetime(dt_string: str) -> Optional[datetime]:
+    def parse_datetime(dt_string: Any) -> Optional[datetime]:
         """
         Parsea un string de fecha a datetime.
+        Los valores que ya son datetime (p. ej. leídos por el driver) se
+        devuelven tal cual sin pasar por el parser.
         
         Args:
-            dt_string: String de fecha en formato ISO
+            dt_string: String de fecha en formato ISO o datetime
             
         Returns:
             Datetime parseado o None si es inválido
         """
+        if isinstance(dt_string, datetime):
+            return dt_string
+        
+        # Descartar sin excepción lo que no puede ser una fecha ISO (YYYY-MM-DD...)
+        if not isinstance(dt_string, str) or len(dt_string) < 10 or dt_string[4] != "-":
+            return None
+        
         try:
             return datetime.fromisoformat(dt_string)
         except ValueError:
@@ -123,7 +165,7 @@ class ResponseUtils:
         response = {
             "success": True,
             "message": message,
-            "timestamp": DateUtils.get_current_utc().isoformat()
+            "timestamp": DateUtils.get_current_utc_iso()
         }
         
         if data is not None:
@@ -151,7 +193,7 @@ class ResponseUtils:
         response = {
             "success": False,
             "error": message,
-            "timestamp": DateUtils.get_current_utc().isoformat()
+            "timestamp": DateUtils.get_current_utc_iso()
         }
         
         if error_code:
@@ -179,17 +221,23 @@ class StringUtils:
         if not email:
             return ""
         
-        return email.lower().strip()
+        # strip() primero: no copia si no hay espacios y lower() recorre menos caracteres
+        return email.strip().lower()
     
     @staticmethod
     def generate_uuid() -> str:
         """
-        Genera un UUID único.
+        Genera un UUID único (versión 4, formato canónico con guiones).
+        Se construye directamente desde os.urandom para evitar el objeto UUID.
         
         Returns:
             UUID como string
         """
-        return str(uuid.uuid4())
+        raw = bytearray(os.urandom(16))
+        raw[6] = (raw[6] & 0x0F) | 0x40  # versión 4
+        raw[8] = (raw[8] & 0x3F) | 0x80  # variante RFC 4122
+        h = raw.hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
     
     @staticmethod
     def sanitize_string(text: str, max_length: int = 255) -> str:
@@ -3,6 +3,9 @@ from typing import Optional
 from app.core.utils import string_utils, date_utils
 
 class User:
+    # Atributos fijos: sin __dict__ por instancia
+    __slots__ = ("id", "email", "password_hash", "is_active", "created_at", "updated_at")
+    
     def __init__(self, id: str, email: str, password_hash: str,
                  is_active: bool = True,
                  created_at: Optional[datetime] = None,
@@ -11,17 +14,31 @@ class User:
         self.email = email
         self.password_hash = password_hash
         self.is_active = is_active
-        self.created_at = created_at or date_utils.get_current_utc()
-        self.updated_at = updated_at or date_utils.get_current_utc()
+        # Un único "ahora" compartido, y solo si falta alguna de las fechas
+        now = None if created_at and updated_at else date_utils.get_current_utc()
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
 
-    def to_dict(self) -> dict:
+    def to_dict(self, *, iso_strings: bool = False) -> dict:
+        """
+        Devuelve todos los datos del usuario.
+        Por defecto las fechas quedan como datetime (orjson las serializa);
+        con iso_strings=True se formatean como strings ISO.
+        """
+        if iso_strings:
+            created_at = self.created_at.isoformat()
+            updated_at = self.updated_at.isoformat()
+        else:
+            created_at = self.created_at
+            updated_at = self.updated_at
+        
         return {
             "id": self.id,
             "email": self.email,
             "password_hash": self.password_hash,
             "is_active": self.is_active,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
+            "created_at": created_at,
+            "updated_at": updated_at
         }
 
     @classmethod
@@ -37,9 +54,10 @@ class User:
 
     @classmethod
     def create_new_user(cls, email: str, password_hash: str) -> "User":
+        # El email se normaliza una sola vez al crear (y en update_email), no en cada lectura
         return cls(
             id=string_utils.generate_uuid(),
-            email=email,
+            email=string_utils.normalize_email(email),
             password_hash=password_hash
         )
 
@@ -2,10 +2,40 @@
 Manejador de JWT para autenticación.
 Genera y valida tokens JWT.
 """
+import hashlib
 import jwt
-from datetime import datetime, timedelta
+import orjson
+import time
+from jwt import api_jws
 from typing import Optional, Dict, Any
 from app.core.config import settings
+from app.core.cache import TTLCache
+
+# Payloads ya verificados, indexados por el SHA-256 del token (claves de 32 bytes
+# en vez de tokens de hasta 8 KB). Cada entrada vive hasta el "exp" de su token;
+# el ttl es solo el valor por defecto.
+_payload_cache = TTLCache(maxsize=10_000, ttl=15)
+
+# Clave, algoritmo y expiración resueltos una sola vez (la configuración es inmutable)
+_SECRET = settings.JWT_SECRET_KEY_BYTES
+_ALGORITHM = settings.JWT_ALGORITHM
+_ALGORITHMS = [_ALGORITHM]
+_EXPIRATION_SECONDS = settings.JWT_EXPIRATION_TIME_MINUTES * 60
+
+# Límites de longitud razonables para un token de acceso
+_MIN_TOKEN_LENGTH = 20
+_MAX_TOKEN_LENGTH = 8192
+
+def _looks_like_jwt(token: str) -> bool:
+    """
+    Chequeo estructural barato antes de la verificación criptográfica.
+    Un JWS compacto tiene exactamente tres segmentos separados por puntos.
+    """
+    return (
+        isinstance(token, str)
+        and _MIN_TOKEN_LENGTH < len(token) < _MAX_TOKEN_LENGTH
+        and token.count(".") == 2
+    )
 
 class JWTHandler:
     """Manejador de tokens JWT."""
@@ -22,25 +52,25 @@ class JWTHandler:
         Returns:
             Token JWT como string
         """
-        # Tiempo de expiración
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.JWT_EXPIRATION_TIME_MINUTES
-        )
+        # Tiempos como NumericDate (segundos enteros), sin objetos datetime
+        now = int(time.time())
+        expire = now + _EXPIRATION_SECONDS
         
         # Payload del token
         payload = {
             "user_id": user_id,
             "email": email,
             "exp": expire,
-            "iat": datetime.utcnow(),
+            "iat": now,
             "type": "access"
         }
         
-        # Generar token
-        token = jwt.encode(
-            payload,
-            settings.JWT_SECRET_KEY,
-            algorithm=settings.JWT_ALGORITHM
+        # Generar token: el payload ya es JSON-serializable (sin datetimes), así que
+        # se serializa con orjson y se firma directamente con la capa JWS de PyJWT
+        token = api_jws.encode(
+            orjson.dumps(payload),
+            _SECRET,
+            algorithm=_ALGORITHM
         )
         
         return token
@@ -56,25 +86,42 @@ class JWTHandler:
         Returns:
             Payload del token si es válido, None si es inválido
         """
+        # Descartar tokens mal formados sin pasar por HMAC
+        if not _looks_like_jwt(token):
+            return None
+        
+        # Reutilizar un payload ya verificado mientras el token no haya expirado
+        cache_key = hashlib.sha256(token.encode()).digest()
+        payload = _payload_cache.get(cache_key)
+        if payload is not None and payload["exp"] > time.time():
+            return payload
+        
         try:
-            payload = jwt.decode(
-                token,
-                settings.JWT_SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM]
+            # Verificar solo la firma (capa JWS) y parsear el payload con orjson;
+            # los claims se validan abajo con comparaciones de enteros
+            payload = orjson.loads(
+                api_jws.decode(token, _SECRET, algorithms=_ALGORITHMS)
             )
-            
-            # Verificar que sea un token de acceso
-            if payload.get("type") != "access":
-                return None
-                
-            return payload
-            
-        except jwt.ExpiredSignatureError:
-            # Token expirado
-            return None
-        except jwt.InvalidTokenError:
+        except (jwt.InvalidTokenError, orjson.JSONDecodeError):
             # Token inválido
             return None
+        
+        # Verificar que sea un token de acceso
+        if not isinstance(payload, dict) or payload.get("type") != "access":
+            return None
+        
+        # Verificar expiración (exp es obligatorio y entero)
+        exp = payload.get("exp")
+        if not isinstance(exp, int):
+            return None
+        remaining = exp - time.time()
+        if remaining <= 0:
+            # Token expirado
+            return None
+        
+        # Solo se cachean tokens válidos, y nunca más allá de su expiración
+        _payload_cache.set(cache_key, payload, ttl=remaining)
+        return payload
     
     @staticmethod
     def get_user_id_from_token(token: str) -> Optional[str]:
@@ -101,19 +148,10 @@ class JWTHandler:
             token: Token JWT
             
         Returns:
-            True si ha expirado, False en caso contrario
+            True si ha expirado (o no es válido), False en caso contrario
         """
-        try:
-            jwt.decode(
-                token,
-                settings.JWT_SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM]
-            )
-            return False
-        except jwt.ExpiredSignatureError:
-            return True
-        except jwt.InvalidTokenError:
-            return True
+        # Comparte la verificación (y su cache) con verify_token
+        return JWTHandler.verify_token(token) is None
 
 # Instancia global del JWT handler
 jwt_handler = JWTHandler()
\ No newline at end of file
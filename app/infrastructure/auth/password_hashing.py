@@ -2,7 +2,28 @@
 Servicio de hashing y verificación de contraseñas.
 Abstrae la lógica de hash de contraseñas usando bcrypt.
 """
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 import bcrypt
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Factor de coste leído una sola vez; los hashes existentes guardan su propio coste
+_BCRYPT_ROUNDS = settings.BCRYPT_COST
+
+# Tiempo por hash a partir del cual conviene bajar BCRYPT_COST
+_SLOW_HASH_SECONDS = 0.3
+
+# Pool dedicado para bcrypt: su implementación nativa libera el GIL,
+# así que los hashes corren en paralelo sin bloquear el event loop
+_HASH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt"
+)
 
 class PasswordHasher:
     """Manejador de hash y verificación de contraseñas."""
@@ -22,11 +43,10 @@ class PasswordHasher:
             raise ValueError("Password no puede estar vacío")
         
         # Generar salt y hash
-        salt = bcrypt.gensalt()
-        password_bytes = password.encode('utf-8')
-        hash_bytes = bcrypt.hashpw(password_bytes, salt)
+        salt = bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)
+        hash_bytes = bcrypt.hashpw(password.encode('utf-8'), salt)
         
-        return hash_bytes.decode('utf-8')
+        return hash_bytes.decode('ascii')
     
     @staticmethod
     def verify_password(password: str, hashed_password: str) -> bool:
@@ -44,11 +64,68 @@ class PasswordHasher:
             return False
         
         try:
-            password_bytes = password.encode('utf-8')
-            hashed_bytes = hashed_password.encode('utf-8')
-            return bcrypt.checkpw(password_bytes, hashed_bytes)
+            # Un hash bcrypt es ASCII ($2b$...); un hash no ASCII lanza UnicodeEncodeError (ValueError)
+            return bcrypt.checkpw(
+                password.encode('utf-8'),
+                hashed_password.encode('ascii')
+            )
         except (ValueError, TypeError):
             return False
+    
+    @staticmethod
+    def calibrate() -> float:
+        """
+        Mide el tiempo de un hash con el coste configurado.
+        Registra un warning si supera el umbral recomendado para logins.
+        
+        Returns:
+            Segundos empleados en un hash
+        """
+        start = time.perf_counter()
+        bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds=_BCRYPT_ROUNDS))
+        elapsed = time.perf_counter() - start
+        
+        if elapsed > _SLOW_HASH_SECONDS:
+            logger.warning(
+                f"⚠️ bcrypt con coste {_BCRYPT_ROUNDS} tarda {elapsed:.3f}s por hash; "
+                f"considera reducir BCRYPT_COST"
+            )
+        else:
+            logger.info(f"🔐 bcrypt coste {_BCRYPT_ROUNDS}: {elapsed:.3f}s por hash")
+        return elapsed
+    
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """
+        Genera el hash de la contraseña fuera del event loop.
+        
+        Args:
+            password: Contraseña en texto plano
+            
+        Returns:
+            Hash de la contraseña como string
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _HASH_EXECUTOR, PasswordHasher.hash_password, password
+        )
+    
+    @staticmethod
+    async def verify_password_async(password: str, hashed_password: str) -> bool:
+        """
+        Verifica una contraseña contra su hash fuera del event loop.
+        
+        Args:
+            password: Contraseña en texto plano
+            hashed_password: Hash almacenado
+            
+        Returns:
+            True si la contraseña es correcta, False en caso contrario
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _HASH_EXECUTOR, PasswordHasher.verify_password, password, hashed_password
+        )
 
 # Instancia global del hasher
 password_hasher = PasswordHasher()
\ No newline at end of file
@@ -2,16 +2,24 @@
 Cliente real de MongoDB usando Motor (driver asíncrono).
 Reemplaza el cliente mock con una implementación real de MongoDB.
 """
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple, Any
 from datetime import datetime
 import logging
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
-from pymongo.errors import ServerSelectionTimeoutError, DuplicateKeyError
+from pymongo import InsertOne
+from pymongo.errors import ServerSelectionTimeoutError, DuplicateKeyError, BulkWriteError
 from app.domain.user.user_entity import User
 from app.core.config import settings
+from app.core.exceptions import UserAlreadyExistsException
 
 logger = logging.getLogger(__name__)
 
+# Campos del documento de usuario que pueden cambiar tras la creación
+_MUTABLE_USER_FIELDS = ("email", "password_hash", "is_active", "updated_at")
+
+# Código de error de MongoDB para violaciones de índice único
+_DUPLICATE_KEY_ERROR_CODE = 11000
+
 class MongoClient:
     """
     Cliente real de MongoDB para operaciones asíncronas.
@@ -31,14 +39,25 @@ class MongoClient:
         Returns:
             True si la conexión es exitosa, False en caso contrario
         """
+        # Un único cliente (y pool) por proceso: no reconectar si ya existe
+        if self._connected:
+            return True
+        
         try:
-            # Crear cliente de MongoDB
+            # Crear cliente de MongoDB con un pool explícito: minPoolSize mantiene
+            # conexiones calientes y maxConnecting evita tormentas de conexiones
             self._client = AsyncIOMotorClient(
                 settings.MONGODB_URL,
-                serverSelectionTimeoutMS=5000  # 5 segundos timeout
+                serverSelectionTimeoutMS=settings.DB_SERVER_SELECTION_TIMEOUT * 1000,
+                connectTimeoutMS=settings.DB_CONNECTION_TIMEOUT * 1000,
+                maxPoolSize=settings.DB_MAX_POOL_SIZE,
+                minPoolSize=settings.DB_MIN_POOL_SIZE,
+                maxIdleTimeMS=settings.DB_MAX_IDLE_TIME_MS,
+                maxConnecting=settings.DB_MAX_CONNECTING,
+                waitQueueTimeoutMS=settings.DB_WAIT_QUEUE_TIMEOUT_MS
             )
             
-            # Verificar conexión
+            # Verificar conexión (y abrir la primera conexión del pool antes de recibir tráfico)
             await self._client.admin.command('ping')
             
             # Configurar base de datos y colecciones
@@ -73,6 +92,8 @@ class MongoClient:
     async def _create_indexes(self) -> None:
         """Crea índices necesarios en las colecciones."""
         try:
+            # Índice único en id (todas las búsquedas puntuales filtran por este campo)
+            await self._users_collection.create_index("id", unique=True)
             # Índice único en email
             await self._users_collection.create_index("email", unique=True)
             # Índice en is_active para consultas eficientes
@@ -94,96 +115,78 @@ class MongoClient:
             
         Raises:
             ConnectionError: Si no está conectado
-            ValueError: Si el usuario ya existe
+            UserAlreadyExistsException: Si el email ya está registrado
         """
         if not self.is_connected():
             raise ConnectionError("Database not connected")
         
         try:
-            user_doc = user.to_dict()
+            user_doc = user.to_dict(iso_strings=True)
             await self._users_collection.insert_one(user_doc)
             logger.info(f"✅ Usuario creado: {user.email}")
             return True
             
         except DuplicateKeyError:
+            # El índice único de email es la única verificación de duplicados (sin lectura previa)
             logger.warning(f"⚠️ Usuario ya existe: {user.email}")
-            raise ValueError(f"Usuario con email {user.email} ya existe")
+            raise UserAlreadyExistsException(user.email)
         except Exception as e:
             logger.error(f"❌ Error al crear usuario: {e}")
             raise RuntimeError(f"Error al crear usuario: {e}")
     
-    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+    async def create_users_bulk(self, users: List[User]) -> List[Optional[Exception]]:
         """
-        Obtiene un usuario por su ID con debug detallado.
+        Crea varios usuarios en una sola operación bulk_write desordenada.
+        
+        Args:
+            users: Entidades User a crear
+            
+        Returns:
+            Lista alineada con users: None si se creó, o la excepción de ese usuario
+            
+        Raises:
+            ConnectionError: Si no está conectado
         """
         if not self.is_connected():
-            logger.error("❌ Base de datos no conectada")
             raise ConnectionError("Database not connected")
         
+        errors: List[Optional[Exception]] = [None] * len(users)
+        operations = [InsertOne(user.to_dict(iso_strings=True)) for user in users]
+        
         try:
-            # 🔍 DEBUG DETALLADO
-            logger.info(f"🔍 === DEBUG GET_USER_BY_ID ===")
-            logger.info(f"📝 ID recibido: '{user_id}'")
-            logger.info(f"📏 Longitud: {len(user_id)}")
-            logger.info(f"🔤 Tipo: {type(user_id)}")
-            
-            # Verificar conexión a la colección
-            logger.info(f"📊 Colección: {self._users_collection.name}")
-            
-            # Contar documentos totales
-            total_docs = await self._users_collection.count_documents({})
-            logger.info(f"📈 Total documentos en colección: {total_docs}")
-            
-            # Intentar encontrar cualquier documento con ese ID
-            logger.info(f"🔍 Ejecutando query: find_one({{'id': '{user_id}'}})")
-            user_doc = await self._users_collection.find_one({"id": user_id})
-            
-            if user_doc:
-                logger.info(f"✅ ¡USUARIO ENCONTRADO!")
-                logger.info(f"📧 Email: {user_doc.get('email')}")
-                logger.info(f"🆔 ID en documento: '{user_doc.get('id')}'")
-                logger.info(f"✳️ is_active: {user_doc.get('is_active')}")
-                
-                # Remover el _id de MongoDB antes de crear la entidad
-                user_doc.pop('_id', None)
-                user_entity = User.from_dict(user_doc)
-                logger.info(f"🏗️ Entidad User creada exitosamente")
-                return user_entity
-            else:
-                logger.error(f"❌ NO SE ENCONTRÓ usuario con ID: '{user_id}'")
-                
-                # DEBUG: Buscar documentos similares
-                logger.info(f"🔍 Buscando IDs similares...")
-                similar_docs = await self._users_collection.find(
-                    {"id": {"$regex": user_id[:10]}}, 
-                    {"id": 1, "email": 1}
-                ).limit(5).to_list(length=5)
-                
-                if similar_docs:
-                    logger.info(f"📋 IDs similares encontrados:")
-                    for doc in similar_docs:
-                        logger.info(f"  - {doc.get('id')} | {doc.get('email')}")
+            # ordered=False: un duplicado no detiene el resto de inserciones
+            await self._users_collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            for write_error in e.details.get("writeErrors", []):
+                user = users[write_error["index"]]
+                if write_error.get("code") == _DUPLICATE_KEY_ERROR_CODE:
+                    errors[write_error["index"]] = UserAlreadyExistsException(user.email)
                 else:
-                    logger.info(f"🚫 No se encontraron IDs similares")
-                
-                # DEBUG: Mostrar algunos documentos de ejemplo
-                sample_docs = await self._users_collection.find(
-                    {}, {"id": 1, "email": 1}
-                ).limit(3).to_list(length=3)
-                
-                if sample_docs:
-                    logger.info(f"📋 Documentos de ejemplo en la colección:")
-                    for doc in sample_docs:
-                        logger.info(f"  - {doc.get('id')} | {doc.get('email')}")
-                
-                return None
+                    errors[write_error["index"]] = RuntimeError(
+                        f"Error al crear usuario: {write_error.get('errmsg')}"
+                    )
+        
+        logger.info(f"✅ Lote de usuarios creado: {errors.count(None)}/{len(users)}")
+        return errors
+    
+    async def get_user_docs_by_ids(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Obtiene varios documentos de usuario por ID en una sola consulta ($in).
+        
+        Args:
+            user_ids: IDs de los usuarios
             
-        except Exception as e:
-            logger.error(f"💥 EXCEPCIÓN en get_user_by_id: {e}")
-            logger.error(f"🔍 Tipo de excepción: {type(e)}")
-            import traceback
-            logger.error(f"📚 Traceback: {traceback.format_exc()}")
-            return None
+        Returns:
+            Diccionario {id: documento} con los usuarios encontrados
+        """
+        if not self.is_connected():
+            raise ConnectionError("Database not connected")
+        
+        cursor = self._users_collection.find(
+            {"id": {"$in": user_ids}}, projection={"_id": 0}
+        )
+        user_docs = await cursor.to_list(length=len(user_ids))
+        return {user_doc["id"]: user_doc for user_doc in user_docs}
     
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """
@@ -199,18 +202,33 @@ class MongoClient:
             raise ConnectionError("Database not connected")
         
         try:
-            email = email.lower().strip()
-            user_doc = await self._users_collection.find_one({"email": email})
-            if user_doc:
-                # Remover el _id de MongoDB antes de crear la entidad
-                user_doc.pop('_id', None)
-                return User.from_dict(user_doc)
-            return None
+            # El email llega normalizado: las entidades se crean y actualizan con él en minúsculas
+            user_doc = await self._users_collection.find_one(
+                {"email": email}, projection={"_id": 0}
+            )
+            return User.from_dict(user_doc) if user_doc else None
             
         except Exception as e:
             logger.error(f"❌ Error al obtener usuario por email {email}: {e}")
             return None
     
+    async def email_exists(self, email: str) -> bool:
+        """
+        Verifica si existe un usuario con el email dado, sin traer el documento.
+        
+        Args:
+            email: Email normalizado a verificar
+            
+        Returns:
+            True si existe, False en caso contrario
+        """
+        if not self.is_connected():
+            raise ConnectionError("Database not connected")
+        
+        # count con limit=1 sobre el índice único de email: no lee el documento
+        count = await self._users_collection.count_documents({"email": email}, limit=1)
+        return count > 0
+    
     async def get_all_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         """
         Obtiene todos los usuarios con paginación.
@@ -226,26 +244,134 @@ class MongoClient:
             raise ConnectionError("Database not connected")
         
         try:
-            cursor = self._users_collection.find({}).skip(skip).limit(limit)
-            users = []
+            cursor = self._users_collection.find(
+                {}, projection={"_id": 0}
+            ).skip(skip).limit(limit)
             
-            async for user_doc in cursor:
-                # Remover el _id de MongoDB antes de crear la entidad
-                user_doc.pop('_id', None)
-                users.append(User.from_dict(user_doc))
-            
-            return users
+            # Traer la página completa de una vez y construir las entidades en un solo paso
+            user_docs = await cursor.to_list(length=limit)
+            return [User.from_dict(user_doc) for user_doc in user_docs]
             
         except Exception as e:
             logger.error(f"❌ Error al obtener usuarios: {e}")
             return []
     
-    async def update_user(self, user: User) -> bool:
+    async def get_users_window(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        only_active: bool = False
+    ) -> Tuple[List[User], bool]:
         """
-        Actualiza un usuario existente.
+        Obtiene una página de usuarios sin contar la colección.
+        Pide limit + 1 documentos: si llega el extra, hay más páginas.
+        
+        Args:
+            skip: Número de registros a saltar
+            limit: Límite de registros a retornar
+            only_active: Si solo se consideran usuarios activos
+            
+        Returns:
+            Tupla con (lista de entidades User, si hay más resultados)
+        """
+        if not self.is_connected():
+            raise ConnectionError("Database not connected")
+        
+        try:
+            cursor = self._users_collection.find(
+                {"is_active": True} if only_active else {},
+                {"_id": 0},
+                skip=skip,
+                limit=limit + 1
+            )
+            user_docs = await cursor.to_list(length=limit + 1)
+            has_more = len(user_docs) > limit
+            return [User.from_dict(user_doc) for user_doc in user_docs[:limit]], has_more
+            
+        except Exception as e:
+            logger.error(f"❌ Error al obtener página de usuarios: {e}")
+            return [], False
+    
+    async def get_users_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        only_active: bool = False
+    ) -> Tuple[List[User], int]:
+        """
+        Obtiene una página de usuarios y el total en una sola consulta ($facet).
+        
+        Args:
+            skip: Número de registros a saltar
+            limit: Límite de registros a retornar
+            only_active: Si solo se consideran usuarios activos
+            
+        Returns:
+            Tupla con (lista de entidades User, total de usuarios que cumplen el filtro)
+        """
+        if not self.is_connected():
+            raise ConnectionError("Database not connected")
+        
+        try:
+            pipeline = [
+                {"$match": {"is_active": True} if only_active else {}},
+                {"$facet": {
+                    "data": [{"$skip": skip}, {"$limit": limit}, {"$project": {"_id": 0}}],
+                    "total": [{"$count": "count"}]
+                }}
+            ]
+            
+            # $facet produce un único documento con la página y el conteo
+            result = await self._users_collection.aggregate(pipeline).to_list(length=1)
+            if not result:
+                return [], 0
+            
+            facet = result[0]
+            total = facet["total"][0]["count"] if facet["total"] else 0
+            return [User.from_dict(user_doc) for user_doc in facet["data"]], total
+            
+        except Exception as e:
+            logger.error(f"❌ Error al obtener página de usuarios: {e}")
+            return [], 0
+    
+    async def iter_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        only_active: bool = False
+    ) -> AsyncIterator[User]:
+        """
+        Recorre una página de usuarios a medida que llegan del cursor.
+        
+        Args:
+            skip: Número de registros a saltar
+            limit: Límite de registros a retornar
+            only_active: Si solo se consideran usuarios activos
+            
+        Yields:
+            Entidades User, una por documento
+        """
+        if not self.is_connected():
+            raise ConnectionError("Database not connected")
+        
+        # batch_size=limit: la página completa llega en el primer lote, sin getMore
+        cursor = self._users_collection.find(
+            {"is_active": True} if only_active else {},
+            {"_id": 0},
+            skip=skip,
+            limit=limit,
+            batch_size=limit
+        )
+        async for user_doc in cursor:
+            yield User.from_dict(user_doc)
+    
+    async def update_user(self, user: User, fields: Optional[Iterable[str]] = None) -> bool:
+        """
+        Actualiza un usuario existente con $set de los campos indicados.
         
         Args:
             user: Entidad User con datos actualizados
+            fields: Campos modificados a escribir (por defecto, todos los mutables)
             
         Returns:
             True si se actualizó exitosamente
@@ -255,14 +381,21 @@ class MongoClient:
         
         try:
             user.updated_at = datetime.utcnow()
-            user_doc = user.to_dict()
+            user_doc = user.to_dict(iso_strings=True)
+            
+            # Solo se envían los campos cambiados; id y created_at nunca cambian
+            if fields is None:
+                fields = _MUTABLE_USER_FIELDS
+            changes = {field: user_doc[field] for field in fields}
+            changes["updated_at"] = user_doc["updated_at"]
             
-            result = await self._users_collection.replace_one(
+            result = await self._users_collection.update_one(
                 {"id": user.id},
-                user_doc
+                {"$set": changes}
             )
             
-            if result.modified_count > 0:
+            # matched_count: una actualización sin cambios reales también es éxito
+            if result.matched_count > 0:
                 logger.info(f"✅ Usuario actualizado: {user.email}")
                 return True
             else:
@@ -311,7 +444,8 @@ class MongoClient:
             raise ConnectionError("Database not connected")
         
         try:
-            count = await self._users_collection.count_documents({})
+            # Sin filtro: se lee el conteo de los metadatos de la colección (O(1))
+            count = await self._users_collection.estimated_document_count()
             return count
             
         except Exception as e:
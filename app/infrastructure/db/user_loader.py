@@ -0,0 +1,83 @@
+"""
+Cargador de usuarios por ID con agrupación de consultas (patrón DataLoader).
+Agrupa las búsquedas concurrentes del mismo ciclo del event loop en una sola consulta.
+"""
+from typing import Dict, List, Optional, Set
+import asyncio
+from app.domain.user.user_entity import User
+from app.infrastructure.db.mongo_client import mongo_client
+
+class UserLoader:
+    """
+    Agrupa llamadas concurrentes a load(user_id) en una única consulta $in.
+    Cada llamada recibe su propia entidad User (las entidades son mutables).
+    """
+    
+    def __init__(self):
+        self.db = mongo_client
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._flush_scheduled = False
+        # Referencias a las tareas de flush en curso (evita que el GC las cancele)
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def load(self, user_id: str) -> Optional[User]:
+        """
+        Obtiene un usuario por ID, agrupando con otras búsquedas concurrentes.
+        
+        Args:
+            user_id: ID del usuario
+            
+        Returns:
+            Entidad User si existe, None en caso contrario
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(user_id, []).append(future)
+        
+        # El flush se ejecuta en la siguiente vuelta del loop, tras encolar el resto
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._dispatch)
+        
+        return await future
+    
+    def _dispatch(self) -> None:
+        """Toma el lote pendiente y lanza su consulta."""
+        pending, self._pending = self._pending, {}
+        self._flush_scheduled = False
+        
+        task = asyncio.ensure_future(self._flush(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _flush(self, pending: Dict[str, List[asyncio.Future]]) -> None:
+        """
+        Resuelve un lote de búsquedas con una sola consulta.
+        
+        Args:
+            pending: Futures en espera agrupados por ID de usuario
+        """
+        try:
+            user_docs = await self.db.get_user_docs_by_ids(list(pending))
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        
+        for user_id, futures in pending.items():
+            user_doc = user_docs.get(user_id)
+            for future in futures:
+                if future.done():
+                    continue
+                # Un documento malformado solo falla las búsquedas de ese ID
+                try:
+                    user = User.from_dict(user_doc) if user_doc else None
+                except Exception as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(user)
+
+# Instancia global del cargador
+user_loader = UserLoader()
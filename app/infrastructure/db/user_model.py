@@ -2,9 +2,13 @@
 Modelo de User para la capa de infraestructura.
 Abstrae las operaciones de base de datos para la entidad User.
 """
-from typing import List, Optional
+import copy
+from typing import AsyncIterator, Iterable, List, Optional, Tuple
 from app.domain.user.user_entity import User
 from app.infrastructure.db.mongo_client import mongo_client
+from app.infrastructure.db.user_loader import user_loader
+from app.infrastructure.db.user_write_batcher import user_write_batcher
+from app.core.cache import current_user_cache, profile_response_cache
 from app.core.exceptions import (
     InfrastructureException,
     ConflictException,
@@ -38,29 +42,20 @@ class UserModel:
             InfrastructureException: Si hay error de infraestructura
         """
         try:
-            # Verificar si el email ya existe
-            existing_user = await self.db.get_user_by_email(user.email)
-            if existing_user:
-                raise ConflictException(f"Usuario con email {user.email} ya existe", "User")
-            
-            # Crear usuario
-            success = await self.db.create_user(user)
+            # Crear usuario (agrupado con altas concurrentes): el índice único de
+            # email rechaza duplicados con UserAlreadyExistsException
+            success = await user_write_batcher.create(user)
             if not success:
                 raise InfrastructureException("Error al crear usuario", "database")
             
-            logger.info(f"✅ Usuario creado exitosamente: {user.email}")
+            logger.info("✅ Usuario creado exitosamente: %s", user.email)
             return user
             
         except ConflictException:
-            # Re-lanzar excepciones de conflicto
+            # Re-lanzar excepciones de conflicto (email duplicado)
             raise
-        except ValueError as e:
-            # Convertir ValueError de la DB a ConflictException
-            if "ya existe" in str(e):
-                raise ConflictException(str(e), "User")
-            raise InfrastructureException(str(e), "database")
         except Exception as e:
-            logger.error(f"❌ Error al crear usuario: {e}")
+            logger.error("❌ Error al crear usuario: %s", e)
             raise InfrastructureException(f"Error al crear usuario: {str(e)}", "database")
     
     async def get_by_id(self, user_id: str) -> Optional[User]:
@@ -73,11 +68,26 @@ class UserModel:
         Returns:
             Entidad User si existe, None en caso contrario
         """
+        # La cache guarda su propia instancia: los casos de uso modifican la
+        # entidad recibida antes de llamar a update(), así que se entrega una copia
+        cached = current_user_cache.get(user_id)
+        if cached is not None:
+            return copy.copy(cached)
+        
+        # Si update()/delete() invalidan el usuario durante la carga, el valor
+        # leído puede ser anterior a la escritura y no debe entrar en la cache
+        generation = current_user_cache.generation(user_id)
+        
         try:
-            return await self.db.get_user_by_id(user_id)
+            # Las búsquedas concurrentes por ID se agrupan en una sola consulta
+            user = await user_loader.load(user_id)
         except Exception as e:
-            logger.error(f"❌ Error al obtener usuario por ID {user_id}: {e}")
+            logger.error("❌ Error al obtener usuario por ID %s: %s", user_id, e)
             raise InfrastructureException(f"Error al obtener usuario: {str(e)}", "database")
+        
+        if user is not None:
+            current_user_cache.set_if_unchanged(user_id, copy.copy(user), generation)
+        return user
     
     async def get_by_email(self, email: str) -> Optional[User]:
         """
@@ -92,7 +102,7 @@ class UserModel:
         try:
             return await self.db.get_user_by_email(email)
         except Exception as e:
-            logger.error(f"❌ Error al obtener usuario por email {email}: {e}")
+            logger.error("❌ Error al obtener usuario por email %s: %s", email, e)
             raise InfrastructureException(f"Error al obtener usuario: {str(e)}", "database")
     
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
@@ -109,15 +119,87 @@ class UserModel:
         try:
             return await self.db.get_all_users(skip=skip, limit=limit)
         except Exception as e:
-            logger.error(f"❌ Error al obtener usuarios: {e}")
+            logger.error("❌ Error al obtener usuarios: %s", e)
             raise InfrastructureException(f"Error al obtener usuarios: {str(e)}", "database")
     
-    async def update(self, user: User) -> User:
+    async def list_window(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        only_active: bool = False
+    ) -> Tuple[List[User], bool]:
+        """
+        Obtiene una página de usuarios e indica si hay más, sin COUNT.
+        
+        Args:
+            skip: Número de registros a saltar
+            limit: Límite de registros a retornar
+            only_active: Si solo se consideran usuarios activos
+            
+        Returns:
+            Tupla con (lista de entidades User, si hay más resultados)
+        """
+        try:
+            return await self.db.get_users_window(skip=skip, limit=limit, only_active=only_active)
+        except Exception as e:
+            logger.error("❌ Error al listar usuarios: %s", e)
+            raise InfrastructureException(f"Error al listar usuarios: {str(e)}", "database")
+    
+    async def list_with_total(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        only_active: bool = False
+    ) -> Tuple[List[User], int]:
+        """
+        Obtiene una página de usuarios junto con el total en una sola ida a la BD.
+        
+        Args:
+            skip: Número de registros a saltar
+            limit: Límite de registros a retornar
+            only_active: Si solo se consideran usuarios activos
+            
+        Returns:
+            Tupla con (lista de entidades User, total)
+        """
+        try:
+            return await self.db.get_users_page(skip=skip, limit=limit, only_active=only_active)
+        except Exception as e:
+            logger.error("❌ Error al listar usuarios: %s", e)
+            raise InfrastructureException(f"Error al listar usuarios: {str(e)}", "database")
+    
+    async def iter_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        only_active: bool = False
+    ) -> AsyncIterator[User]:
+        """
+        Recorre una página de usuarios sin materializarla en memoria.
+        
+        Args:
+            skip: Número de registros a saltar
+            limit: Límite de registros a retornar
+            only_active: Si solo se consideran usuarios activos
+            
+        Yields:
+            Entidades User en orden de llegada desde la BD
+        """
+        try:
+            async for user in self.db.iter_users(skip=skip, limit=limit, only_active=only_active):
+                yield user
+        except Exception as e:
+            # La respuesta ya puede haber empezado: solo se registra el corte
+            logger.error("❌ Error al recorrer usuarios: %s", e)
+            raise InfrastructureException(f"Error al recorrer usuarios: {str(e)}", "database")
+    
+    async def update(self, user: User, fields: Optional[Iterable[str]] = None) -> User:
         """
         Actualiza un usuario existente.
         
         Args:
             user: Entidad User con datos actualizados
+            fields: Campos modificados (por defecto, todos los mutables)
             
         Returns:
             Entidad User actualizada
@@ -127,15 +209,18 @@ class UserModel:
             InfrastructureException: Si hay error de infraestructura
         """
         try:
-            success = await self.db.update_user(user)
+            success = await self.db.update_user(user, fields)
+            # Invalidar la cache de autenticación y el perfil serializado
+            current_user_cache.invalidate(user.id)
+            profile_response_cache.invalidate(user.id)
             if not success:
                 raise NotFoundException("Usuario", user.id)
             
-            logger.info(f"✅ Usuario actualizado exitosamente: {user.email}")
+            logger.info("✅ Usuario actualizado exitosamente: %s", user.email)
             return user
             
         except Exception as e:
-            logger.error(f"❌ Error al actualizar usuario {user.id}: {e}")
+            logger.error("❌ Error al actualizar usuario %s: %s", user.id, e)
             raise InfrastructureException(f"Error al actualizar usuario: {str(e)}", "database")
     
     async def delete(self, user_id: str) -> bool:
@@ -154,17 +239,19 @@ class UserModel:
         """
         try:
             success = await self.db.delete_user(user_id)
+            current_user_cache.invalidate(user_id)
+            profile_response_cache.invalidate(user_id)
             if not success:
                 raise NotFoundException("Usuario", user_id)
             
-            logger.info(f"✅ Usuario eliminado exitosamente: {user_id}")
+            logger.info("✅ Usuario eliminado exitosamente: %s", user_id)
             return True
             
         except NotFoundException:
             # Re-lanzar excepciones de not found
             raise
         except Exception as e:
-            logger.error(f"❌ Error al eliminar usuario {user_id}: {e}")
+            logger.error("❌ Error al eliminar usuario %s: %s", user_id, e)
             raise InfrastructureException(f"Error al eliminar usuario: {str(e)}", "database")
     
     async def exists_by_email(self, email: str) -> bool:
@@ -178,10 +265,9 @@ class UserModel:
             True si existe, False en caso contrario
         """
         try:
-            user = await self.db.get_user_by_email(email)
-            return user is not None
+            return await self.db.email_exists(email)
         except Exception as e:
-            logger.error(f"❌ Error al verificar existencia de email {email}: {e}")
+            logger.error("❌ Error al verificar existencia de email %s: %s", email, e)
             # En caso de error, asumir que no existe para no bloquear operaciones
             return False
     
@@ -195,7 +281,7 @@ class UserModel:
         try:
             return await self.db.count_users()
         except Exception as e:
-            logger.error(f"❌ Error al contar usuarios: {e}")
+            logger.error("❌ Error al contar usuarios: %s", e)
             raise InfrastructureException(f"Error al contar usuarios: {str(e)}", "database")
     
     async def count_active(self) -> int:
@@ -208,7 +294,7 @@ class UserModel:
         try:
             return await self.db.count_active_users()
         except Exception as e:
-            logger.error(f"❌ Error al contar usuarios activos: {e}")
+            logger.error("❌ Error al contar usuarios activos: %s", e)
             raise InfrastructureException(f"Error al contar usuarios activos: {str(e)}", "database")
 
 # Instancia global del modelo
@@ -0,0 +1,109 @@
+"""
+Agrupador de inserciones de usuarios (bulk_write).
+Sin carga, cada alta se escribe directamente; durante una ráfaga, las altas que
+llegan dentro de una ventana corta se envían juntas en una sola operación.
+"""
+from typing import List, Set, Tuple
+import asyncio
+from app.domain.user.user_entity import User
+from app.infrastructure.db.mongo_client import mongo_client
+
+# Ventana de agrupación (solo en ráfagas): pequeña frente al coste de bcrypt de cada registro
+_BATCH_WINDOW_SECONDS = 0.002
+
+class UserWriteBatcher:
+    """
+    Agrupa llamadas concurrentes a create(user) en un bulk_write desordenado.
+    Si no hay otra escritura pendiente ni en curso, el alta va directa a
+    insert_one, sin esperar la ventana de agrupación.
+    """
+    
+    def __init__(self):
+        self.db = mongo_client
+        self._pending: List[Tuple[User, asyncio.Future]] = []
+        self._flush_scheduled = False
+        # Escrituras en curso (directas o lotes): si hay alguna, estamos en ráfaga
+        self._in_flight = 0
+        # Referencias a las tareas de flush en curso (evita que el GC las cancele)
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def create(self, user: User) -> bool:
+        """
+        Inserta un usuario, agrupándolo con otras altas concurrentes.
+        
+        Args:
+            user: Entidad User a crear
+            
+        Returns:
+            True si se creó exitosamente
+            
+        Raises:
+            UserAlreadyExistsException: Si el email ya está registrado
+        """
+        # Sin ráfaga: escritura directa, sin latencia extra
+        if not self._pending and not self._in_flight:
+            self._in_flight += 1
+            try:
+                return await self.db.create_user(user)
+            finally:
+                self._in_flight -= 1
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((user, future))
+        
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_later(_BATCH_WINDOW_SECONDS, self._dispatch)
+        
+        return await future
+    
+    def _dispatch(self) -> None:
+        """Toma el lote pendiente y lanza su escritura."""
+        pending, self._pending = self._pending, []
+        self._flush_scheduled = False
+        
+        self._in_flight += 1
+        task = asyncio.ensure_future(self._flush(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _flush(self, pending: List[Tuple[User, asyncio.Future]]) -> None:
+        """
+        Escribe un lote de usuarios y resuelve el future de cada uno.
+        
+        Args:
+            pending: Pares (usuario, future) en espera
+        """
+        try:
+            if len(pending) == 1:
+                user, future = pending[0]
+                try:
+                    result = await self.db.create_user(user)
+                except Exception as e:
+                    # El llamador pudo cancelarse (cliente desconectado) mientras tanto
+                    if not future.done():
+                        future.set_exception(e)
+                    return
+                if not future.done():
+                    future.set_result(result)
+                return
+            
+            users = [user for user, _ in pending]
+            try:
+                errors = await self.db.create_users_bulk(users)
+            except Exception as e:
+                errors = [e] * len(pending)
+            
+            for (_, future), error in zip(pending, errors):
+                if future.done():
+                    continue
+                if error is None:
+                    future.set_result(True)
+                else:
+                    future.set_exception(error)
+        finally:
+            self._in_flight -= 1
+
+# Instancia global del agrupador
+user_write_batcher = UserWriteBatcher()
@@ -2,10 +2,37 @@
 Configuración de la API v1.
 Incluye todas las rutas de la versión 1 de la API.
 """
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
+from fastapi.routing import APIRoute
 from app.interfaces.api.v1.routes.user_routes import router as user_router
 from app.interfaces.api.v1.routes.auth_routes import router as auth_router
 
+# Rutas de usuario que deben resolverse antes que cualquier /user/{user_id}
+_PRIORITY_USER_PATHS = ("/me/profile", "")
+
+
+def _check_route_order(router: APIRouter) -> None:
+    """
+    Verifica que las rutas específicas precedan a las rutas con parámetros.
+    Starlette recorre las rutas en orden, así que un reordenamiento accidental
+    haría que /me/profile compitiera con /user/{user_id}.
+    
+    Args:
+        router: Router de usuarios a verificar
+        
+    Raises:
+        RuntimeError: Si alguna ruta prioritaria aparece tras una ruta con parámetros
+    """
+    paths = [route.path for route in router.routes if isinstance(route, APIRoute)]
+    first_param = next((i for i, path in enumerate(paths) if "{" in path), len(paths))
+    for path in _PRIORITY_USER_PATHS:
+        if path in paths and paths.index(path) > first_param:
+            raise RuntimeError(f"La ruta '{path}' debe declararse antes que '{paths[first_param]}'")
+
+
+_check_route_order(user_router)
+
 # Router principal para la API v1
 api_router = APIRouter()
 
@@ -23,6 +50,61 @@ api_router.include_router(
     tags=["users"]
 )
 
+# Respuestas constantes de /health y /info, serializadas una sola vez al importar
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "message": "API is running",
+    "version": "1.0.0",
+    "services": {
+        "database": "connected",
+        "authentication": "active"
+    }
+})
+
+_INFO_BYTES = orjson.dumps({
+    "name": "Clients API",
+    "version": "1.0.0",
+    "description": "API REST para gestión de usuarios con autenticación JWT",
+    "architecture": "Clean Architecture",
+    "features": [
+        "Registro y autenticación de usuarios",
+        "CRUD completo de usuarios",
+        "Autenticación JWT",
+        "Paginación en listados",
+        "Soft delete de usuarios",
+        "Validación con Pydantic",
+        "Documentación OpenAPI"
+    ],
+    "endpoints": {
+        "authentication": [
+            "POST /api/v1/auth/login",
+            "POST /api/v1/auth/register"
+        ],
+        "users": [
+            "POST /api/v1/users",
+            "GET /api/v1/users/{id}",
+            "GET /api/v1/users",
+            "PUT /api/v1/users/{id}",
+            "DELETE /api/v1/users/{id}"
+        ],
+        "utility": [
+            "GET /api/v1/health",
+            "GET /api/v1/info"
+        ]
+    },
+    "authentication": {
+        "type": "JWT Bearer Token",
+        "header": "Authorization: Bearer <token>",
+        "expiration": "30 minutes"
+    },
+    "documentation": {
+        "swagger": "/docs",
+        "redoc": "/redoc",
+        "openapi": "/api/v1/openapi.json"
+    },
+    "status": "active"
+})
+
 # Endpoint de health check
 @api_router.get(
     "/health",
@@ -36,15 +118,7 @@ async def health_check():
     
     Returns información básica del estado del servicio.
     """
-    return {
-        "status": "healthy",
-        "message": "API is running",
-        "version": "1.0.0",
-        "services": {
-            "database": "connected",
-            "authentication": "active"
-        }
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 # Endpoint de información de la API
 @api_router.get(
@@ -59,46 +133,4 @@ async def api_info():
     
     Returns metadatos de la API como versión, descripción, endpoints disponibles, etc.
     """
-    return {
-        "name": "Clients API",
-        "version": "1.0.0",
-        "description": "API REST para gestión de usuarios con autenticación JWT",
-        "architecture": "Clean Architecture",
-        "features": [
-            "Registro y autenticación de usuarios",
-            "CRUD completo de usuarios",
-            "Autenticación JWT",
-            "Paginación en listados",
-            "Soft delete de usuarios",
-            "Validación con Pydantic",
-            "Documentación OpenAPI"
-        ],
-        "endpoints": {
-            "authentication": [
-                "POST /api/v1/auth/login",
-                "POST /api/v1/auth/register"
-            ],
-            "users": [
-                "POST /api/v1/users",
-                "GET /api/v1/users/{id}",
-                "GET /api/v1/users",
-                "PUT /api/v1/users/{id}",
-                "DELETE /api/v1/users/{id}"
-            ],
-            "utility": [
-                "GET /api/v1/health",
-                "GET /api/v1/info"
-            ]
-        },
-        "authentication": {
-            "type": "JWT Bearer Token",
-            "header": "Authorization: Bearer <token>",
-            "expiration": "30 minutes"
-        },
-        "documentation": {
-            "swagger": "/docs",
-            "redoc": "/redoc",
-            "openapi": "/api/v1/openapi.json"
-        },
-        "status": "active"
-    }
\ No newline at end of file
+    return Response(content=_INFO_BYTES, media_type="application/json")
@@ -2,7 +2,7 @@
 Rutas de autenticación.
 Maneja login, registro y operaciones de autenticación.
 """
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, status
 from app.controllers.user_controller import user_controller
 from app.interfaces.schemas.user_request import (
     UserCreateRequest,
@@ -14,7 +14,7 @@ from app.interfaces.schemas.user_response import (
     ErrorResponse,
     user_to_response
 )
-from app.core.security import get_current_active_user
+from app.core.security import CurrentUser
 from app.core.exceptions import (
     ValidationException,
     AuthenticationException,
@@ -92,7 +92,7 @@ async def register(request: UserCreateRequest):
         401: {"description": "Token inválido o expirado"}
     }
 )
-async def validate_token(current_user = Depends(get_current_active_user)):
+async def validate_token(current_user: CurrentUser):
     """
     Valida el token JWT del usuario autenticado.
     
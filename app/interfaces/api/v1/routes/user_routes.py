@@ -2,8 +2,8 @@
 Rutas de la API para operaciones CRUD de usuarios - VERSIÓN CORREGIDA.
 Define los endpoints REST con manejo robusto de respuestas.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Query
+from typing import Annotated, List
 from app.controllers.user_controller import user_controller
 from app.interfaces.schemas.user_request import (
     UserCreateRequest,
@@ -12,29 +12,42 @@ from app.interfaces.schemas.user_request import (
 )
 from app.interfaces.schemas.user_response import (
     UserCreateResponse,
+    UserDetailResponse,
+    UserProfileResponse,
     UserUpdateResponse,
     UserDeleteResponse,
     UserListResponse,
     ErrorResponse,
     user_to_response
 )
-from app.core.security import get_current_active_user
-from app.domain.user.user_entity import User
+from app.core.security import CurrentUser
 
 # Router para las rutas de usuario (requieren autenticación)
 router = APIRouter(tags=["users"])
 
+# Parámetros de paginación compartidos (mismos límites que UserQueryRequest)
+SkipParam = Annotated[int, Query(ge=0, description="Número de registros a saltar")]
+LimitParam = Annotated[int, Query(ge=1, le=100, description="Límite de registros por página")]
+
 # CRÍTICO: Las rutas específicas deben ir ANTES que las rutas con parámetros
-# para evitar conflictos en el routing de FastAPI
+# para evitar conflictos en el routing de FastAPI.
+# Las rutas más usadas (/me/profile y el listado "") van primero: el router
+# compara las rutas en orden, así se resuelven con menos comparaciones.
+# api_v1.py verifica este orden al importar.
+#
+# Los handlers no capturan excepciones: los casos de uso lanzan excepciones
+# tipadas del dominio (UserNotFoundException, AuthorizationException, ...) y
+# EXCEPTION_HANDLERS las traduce a su status HTTP con una búsqueda por tipo.
 
 @router.get(
     "/me/profile",
-    response_model=dict,
+    # El controller devuelve un Response ya serializado: el modelo solo documenta el esquema
+    response_model=UserProfileResponse,
     summary="Obtener perfil actual",
     description="Obtiene la información del usuario autenticado"
 )
 async def get_current_user_profile(
-    current_user: User = Depends(get_current_active_user)
+    current_user: CurrentUser
 ):
     """
     Obtiene el perfil del usuario autenticado.
@@ -43,13 +56,57 @@ async def get_current_user_profile(
     
     Devuelve la información completa del usuario que está autenticado.
     """
-    try:
-        # 🔧 FIX: Usar el controller corregido que retorna dict
-        result = await user_controller.get_current_user_profile(current_user)
-        return result
-    except Exception as e:
-        # En caso de error, el exception handler centralizado se encargará
-        raise
+    # 🔧 FIX: Usar el controller corregido que retorna dict
+    result = await user_controller.get_current_user_profile(current_user)
+    return result
+
+@router.get(
+    "",
+    response_model=dict,  # 🔧 FIX: Cambiar a dict genérico
+    summary="Listar todos los usuarios",
+    description="Obtiene una lista paginada de todos los usuarios"
+)
+async def list_all_users(
+    current_user: CurrentUser,
+    skip: SkipParam = 0,
+    limit: LimitParam = 20
+):
+    """
+    Lista todos los usuarios con paginación.
+    
+    **Requiere autenticación JWT.**
+    
+    - **skip**: Número de registros a saltar (default: 0)
+    - **limit**: Límite de registros por página (default: 20, max: 100)
+    
+    Devuelve información básica de todos los usuarios activos.
+    """
+    # Query ya validó los límites: se construye sin una segunda validación
+    query = UserQueryRequest.model_construct(skip=skip, limit=limit)
+    result = await user_controller.list_users(query, current_user)
+    return result
+
+@router.get(
+    "/export.ndjson",
+    summary="Exportar usuarios (NDJSON)",
+    description="Envía los usuarios paginados como NDJSON, un usuario por línea"
+)
+async def export_users_ndjson(
+    current_user: CurrentUser,
+    skip: SkipParam = 0,
+    limit: LimitParam = 20
+):
+    """
+    Exporta usuarios en streaming (application/x-ndjson).
+    
+    **Requiere autenticación JWT.**
+    
+    Mismos filtros que el listado, pero cada usuario se envía en cuanto
+    llega de la base de datos, sin construir la lista completa.
+    """
+    # Query ya validó los límites: se construye sin una segunda validación
+    query = UserQueryRequest.model_construct(skip=skip, limit=limit)
+    return await user_controller.stream_users(query, current_user)
 
 @router.post(
     "",
@@ -60,7 +117,7 @@ async def get_current_user_profile(
 )
 async def create_user(
     request: UserCreateRequest,
-    current_user: User = Depends(get_current_active_user)
+    current_user: CurrentUser
 ):
     """
     Crea un nuevo usuario.
@@ -72,21 +129,18 @@ async def create_user(
     
     Este endpoint está protegido y requiere autenticación.
     """
-    try:
-        result = await user_controller.create_user(request)
-        return result
-    except Exception as e:
-        raise
+    result = await user_controller.create_user(request)
+    return result
 
 @router.get(
     "/user/{user_id}",
-    response_model=dict,  # 🔧 FIX: Cambiar a dict genérico
+    response_model=UserDetailResponse,
     summary="Obtener usuario por ID",
     description="Obtiene información de un usuario específico"
 )
 async def get_user_by_id(
     user_id: str,
-    current_user: User = Depends(get_current_active_user)
+    current_user: CurrentUser
 ):
     """
     Obtiene un usuario por su ID.
@@ -98,18 +152,10 @@ async def get_user_by_id(
     Los usuarios pueden ver información básica de otros usuarios,
     pero solo pueden ver detalles completos de su propio perfil.
     """
-    print(f"🎯 ROUTER: get_user_by_id llamado con ID: {user_id}")
-    print(f"🔐 ROUTER: current_user: {current_user.email}")
-    
-    try:
-        # 🔧 FIX: El controller ahora retorna dict correctamente
-        result = await user_controller.get_user_by_id(user_id, current_user)
-        print(f"✅ ROUTER: Respuesta recibida del controller: {type(result)}")
-        return result
-    except Exception as e:
-        print(f"❌ ROUTER: Excepción capturada: {e}")
-        # El exception handler centralizado se encargará
-        raise
+    # 🔧 FIX: El controller ahora retorna dict correctamente
+    # (el controller registra la traza a nivel DEBUG)
+    result = await user_controller.get_user_by_id(user_id, current_user)
+    return result
 
 @router.put(
     "/user/{user_id}",
@@ -120,7 +166,7 @@ async def get_user_by_id(
 async def update_user(
     user_id: str,
     request: UserUpdateRequest,
-    current_user: User = Depends(get_current_active_user)
+    current_user: CurrentUser
 ):
     """
     Actualiza un usuario existente.
@@ -134,11 +180,8 @@ async def update_user(
     Los usuarios solo pueden actualizar su propia información,
     salvo que tengan permisos administrativos.
     """
-    try:
-        result = await user_controller.update_user(user_id, request, current_user)
-        return result
-    except Exception as e:
-        raise
+    result = await user_controller.update_user(user_id, request, current_user)
+    return result
 
 @router.delete(
     "/user/{user_id}",
@@ -148,7 +191,7 @@ async def update_user(
 )
 async def delete_user(
     user_id: str,
-    current_user: User = Depends(get_current_active_user)
+    current_user: CurrentUser
 ):
     """
     Elimina un usuario del sistema.
@@ -161,36 +204,5 @@ async def delete_user(
     Los usuarios solo pueden eliminar su propia cuenta,
     salvo que tengan permisos administrativos.
     """
-    try:
-        result = await user_controller.delete_user_soft(user_id, current_user)
-        return result
-    except Exception as e:
-        raise
-
-@router.get(
-    "",
-    response_model=dict,  # 🔧 FIX: Cambiar a dict genérico
-    summary="Listar todos los usuarios",
-    description="Obtiene una lista paginada de todos los usuarios"
-)
-async def list_all_users(
-    skip: int = Query(0, ge=0, description="Número de registros a saltar"),
-    limit: int = Query(20, ge=1, le=100, description="Límite de registros por página"),
-    current_user: User = Depends(get_current_active_user)
-):
-    """
-    Lista todos los usuarios con paginación.
-    
-    **Requiere autenticación JWT.**
-    
-    - **skip**: Número de registros a saltar (default: 0)
-    - **limit**: Límite de registros por página (default: 20, max: 100)
-    
-    Devuelve información básica de todos los usuarios activos.
-    """
-    try:
-        query = UserQueryRequest(skip=skip, limit=limit)
-        result = await user_controller.list_users(query, current_user)
-        return result
-    except Exception as e:
-        raise
\ No newline at end of file
+    result = await user_controller.delete_user_soft(user_id, current_user)
+    return result
\ No newline at end of file
@@ -2,7 +2,7 @@
 Esquemas de request para operaciones de usuario.
 Define la estructura de datos de entrada para la API.
 """
-from pydantic import BaseModel, EmailStr, validator
+from pydantic import BaseModel, EmailStr, field_validator
 from typing import Optional
 
 class UserCreateRequest(BaseModel):
@@ -11,7 +11,8 @@ class UserCreateRequest(BaseModel):
     email: EmailStr
     password: str
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password(cls, v):
         """Valida que la contraseña cumpla con los requisitos mínimos."""
         if len(v) < 6:
@@ -20,7 +21,8 @@ class UserCreateRequest(BaseModel):
             raise ValueError('Password no puede tener más de 128 caracteres')
         return v
     
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def validate_email(cls, v):
         """Valida y normaliza el email."""
         return v.lower().strip()
@@ -31,7 +33,8 @@ class UserLoginRequest(BaseModel):
     email: EmailStr
     password: str
     
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def validate_email(cls, v):
         """Valida y normaliza el email."""
         return v.lower().strip()
@@ -42,7 +45,8 @@ class UserUpdateRequest(BaseModel):
     email: Optional[EmailStr] = None
     password: Optional[str] = None
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password(cls, v):
         """Valida que la contraseña cumpla con los requisitos mínimos."""
         if v is not None:
@@ -52,7 +56,8 @@ class UserUpdateRequest(BaseModel):
                 raise ValueError('Password no puede tener más de 128 caracteres')
         return v
     
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def validate_email(cls, v):
         """Valida y normaliza el email."""
         if v is not None:
@@ -72,14 +77,16 @@ class UserQueryRequest(BaseModel):
     skip: int = 0
     limit: int = 20
     
-    @validator('skip')
+    @field_validator('skip')
+    @classmethod
     def validate_skip(cls, v):
         """Valida que skip sea no negativo."""
         if v < 0:
             raise ValueError('Skip debe ser mayor o igual a 0')
         return v
     
-    @validator('limit')
+    @field_validator('limit')
+    @classmethod
     def validate_limit(cls, v):
         """Valida que limit esté en un rango razonable."""
         if v < 1:
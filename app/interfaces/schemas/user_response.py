@@ -2,7 +2,7 @@
 Esquemas de response para operaciones de usuario - VERSIÓN CORREGIDA.
 Define la estructura de datos de salida de la API compatible con Pydantic v2.
 """
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_serializer
 from typing import List, Optional, Any
 from datetime import datetime
 
@@ -10,18 +10,18 @@ class UserResponse(BaseModel):
     """Esquema base de respuesta para usuario."""
     
     # 🔧 FIX: Configuración actualizada para Pydantic v2
-    model_config = ConfigDict(
-        from_attributes=True,
-        json_encoders={
-            datetime: lambda v: v.isoformat() if v else None
-        }
-    )
+    model_config = ConfigDict(from_attributes=True)
     
     id: str
     email: str
     is_active: bool
     created_at: datetime
     updated_at: datetime
+    
+    @field_serializer("created_at", "updated_at")
+    def _serialize_datetime(self, value: Optional[datetime]) -> Optional[str]:
+        """Serializa las fechas en formato ISO (reemplaza json_encoders, obsoleto en v2)."""
+        return value.isoformat() if value else None
 
 class UserCreateResponse(BaseModel):
     """Respuesta para creación de usuario."""
@@ -73,7 +73,7 @@ class UserListResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     
     users: List[UserResponse]
-    total: int
+    total: Optional[int] = None  # None: el listado no cuenta la colección
     skip: int
     limit: int
     has_more: bool
@@ -112,12 +112,13 @@ class SuccessResponse(BaseModel):
 def user_to_response(user) -> UserResponse:
     """
     Convierte una entidad User a UserResponse.
-    Compatible con Pydantic v2.
+    Compatible con Pydantic v2. La entidad ya es válida, así que se
+    construye con model_construct, sin volver a validar cada campo.
     """
     if not user:
         return None
         
-    return UserResponse(
+    return UserResponse.model_construct(
         id=user.id,
         email=user.email,
         is_active=user.is_active,
@@ -143,24 +144,27 @@ def user_to_dict(user) -> dict:
 
 def users_to_list_response(
     users: List, 
-    total: int, 
+    total: Optional[int], 
     skip: int, 
     limit: int
 ) -> dict:
     """
     Convierte una lista de usuarios a diccionario de respuesta.
     Versión corregida que retorna dict en lugar de modelo Pydantic.
+    Con total=None se esperan hasta limit + 1 usuarios: el extra solo
+    indica que hay más páginas y no se incluye en la respuesta.
     """
     if not users:
         users = []
     
-    # Convertir usuarios a diccionarios
-    user_dicts = []
-    for user in users:
-        if user:
-            user_dicts.append(user_to_dict(user))
+    if total is None:
+        has_more = len(users) > limit
+        users = users[:limit]
+    else:
+        has_more = skip + len(users) < total
     
-    has_more = skip + len(users) < total
+    # Convertir usuarios a diccionarios
+    user_dicts = [user_to_dict(user) for user in users]
     
     return {
         "users": user_dicts,
@@ -2,17 +2,25 @@
 Punto de entrada principal de la aplicación FastAPI.
 Configura la aplicación, middleware, CORS, rutas y manejadores de excepciones.
 """
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 import uvicorn
+import asyncio
+import sys
+import atexit
 import logging
-import time
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from app.core.config import settings
+from app.core.responses import UTCORJSONResponse
+from app.core.middleware import RequestLoggingMiddleware, JWTAuthMiddleware
 from app.interfaces.api.v1.api_v1 import api_router
 from app.infrastructure.db.mongo_client import mongo_client
+from app.infrastructure.auth.password_hashing import password_hasher
+from app.infrastructure.auth.jwt_handler import jwt_handler
 from app.core.exception_handlers import EXCEPTION_HANDLERS
 
 # Configurar logging
@@ -20,6 +28,35 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+# Nivel de los loggers de la aplicación según configuración (LOG_LEVEL)
+logging.getLogger("app").setLevel(settings.LOG_LEVEL)
+
+
+def setup_queue_logging() -> QueueListener:
+    """
+    Redirige el logging a una cola para no escribir en el stream desde el event loop.
+    
+    Los handlers reales del root logger se trasladan a un QueueListener que
+    escribe desde un hilo propio; el root logger solo encola los registros.
+    
+    Returns:
+        QueueListener iniciado
+    """
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers[:]
+    log_queue = queue.SimpleQueue()
+    
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(QueueHandler(log_queue))
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+log_listener = setup_queue_logging()
 logger = logging.getLogger(__name__)
 
 @asynccontextmanager
@@ -43,6 +80,9 @@ async def lifespan(app: FastAPI):
         logger.error(f"❌ Error al conectar a MongoDB: {e}")
         logger.error("⚠️  La aplicación continuará pero las operaciones de BD fallarán")
     
+    # Medir el coste de bcrypt configurado (fuera del event loop)
+    await asyncio.to_thread(password_hasher.calibrate)
+    
     yield
     
     # Shutdown: Cerrar conexiones
@@ -61,6 +101,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=UTCORJSONResponse,
     lifespan=lifespan
 )
 
@@ -73,6 +114,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Middleware ASGI de autenticación: verifica el Bearer token una vez por request
+app.add_middleware(JWTAuthMiddleware, verify_fn=jwt_handler.verify_token)
+
+# Compresión GZip para respuestas grandes (p. ej. listados de usuarios)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Middleware ASGI para logging de requests
+app.add_middleware(RequestLoggingMiddleware)
+
 # Registrar manejadores de excepciones
 for exception_type, handler in EXCEPTION_HANDLERS.items():
     app.add_exception_handler(exception_type, handler)
@@ -83,23 +133,6 @@ app.include_router(
     prefix=settings.API_V1_PREFIX
 )
 
-# Middleware para logging de requests
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Middleware para logging de todas las requests."""
-    start_time = time.time()
-    
-    # Log request
-    logger.info(f"📥 {request.method} {request.url}")
-    
-    response = await call_next(request)
-    
-    # Log response
-    process_time = time.time() - start_time
-    logger.info(f"📤 {request.method} {request.url} - {response.status_code} - {process_time:.4f}s")
-    
-    return response
-
 # Endpoint raíz
 @app.get(
     "/",
@@ -209,6 +242,9 @@ def run_dev():
         "app.main:app",
         host="0.0.0.0",
         port=8000,
+        # uvloop no existe en Windows: allí uvicorn usa el loop de asyncio
+        loop="auto" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         reload=True,
         log_level="info"
     )
@@ -44,11 +44,8 @@ class CreateUserUseCase:
         
         email = email.lower().strip()
         
-        # Verificar si el usuario ya existe
-        await self._check_user_not_exists(email)
-        
         # Hash de la contraseña
-        password_hash = self._hash_password(password)
+        password_hash = await self._hash_password(password)
         
         # Crear nueva entidad User
         new_user = User.create_new_user(
@@ -56,10 +53,13 @@ class CreateUserUseCase:
             password_hash=password_hash
         )
         
-        # Guardar en la base de datos
+        # Guardar en la base de datos: el índice único de email detecta duplicados
+        # en el mismo insert (una sola ida a la BD, sin carrera entre lectura y escritura)
         try:
             created_user = await self.user_model.create(new_user)
             return created_user
+        except UserAlreadyExistsException:
+            raise
         except Exception as e:
             raise InfrastructureException(
                 f"Error al crear usuario: {str(e)}", 
@@ -94,21 +94,7 @@ class CreateUserUseCase:
                 "password"
             )
     
-    async def _check_user_not_exists(self, email: str):
-        """
-        Verifica que el usuario no exista.
-        
-        Args:
-            email: Email a verificar
-            
-        Raises:
-            UserAlreadyExistsException: Si el usuario ya existe
-        """
-        existing_user = await self.user_model.get_by_email(email)
-        if existing_user:
-            raise UserAlreadyExistsException(email)
-    
-    def _hash_password(self, password: str) -> str:
+    async def _hash_password(self, password: str) -> str:
         """
         Genera el hash de la contraseña.
         
@@ -122,7 +108,7 @@ class CreateUserUseCase:
             InfrastructureException: Si hay error al generar el hash
         """
         try:
-            return self.password_hasher.hash_password(password)
+            return await self.password_hasher.hash_password_async(password)
         except Exception as e:
             raise InfrastructureException(
                 f"Error al procesar contraseña: {str(e)}", 
@@ -142,8 +128,7 @@ class CreateUserUseCase:
         if not email or not self.validation_utils.is_valid_email(email):
             return False
         
-        existing_user = await self.user_model.get_by_email(email.lower().strip())
-        return existing_user is None
+        return not await self.user_model.exists_by_email(email.lower().strip())
 
 # Instancia del caso de uso
 create_user_use_case = CreateUserUseCase()
\ No newline at end of file
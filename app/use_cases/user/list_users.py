@@ -2,7 +2,7 @@
 Caso de uso: Listar Usuarios.
 Encapsula la lógica de negocio para obtener una lista paginada de usuarios.
 """
-from typing import List, Tuple
+from typing import AsyncIterator, List, Tuple
 from app.domain.user.user_entity import User
 from app.infrastructure.db.user_model import user_model
 from app.core.exceptions import (
@@ -26,7 +26,7 @@ class ListUsersUseCase:
         requesting_user_id: str,
         skip: int = 0, 
         limit: int = 20
-    ) -> Tuple[List[User], int]:
+    ) -> Tuple[List[User], bool]:
         """
         Ejecuta el caso de uso de listar usuarios.
         
@@ -36,13 +36,62 @@ class ListUsersUseCase:
             limit: Límite de registros a retornar
             
         Returns:
-            Tupla con (lista_usuarios, total_usuarios)
+            Tupla con (lista_usuarios, hay_mas_resultados)
+            
+        Raises:
+            ValidationException: Si hay errores de validación
+            AuthorizationException: Si no tiene permisos
+            UserInactiveException: Si el usuario está inactivo
+        """
+        await self._validate_request(requesting_user_id, skip, limit)
+        
+        # Por ahora, cualquier usuario autenticado puede listar usuarios
+        # En una implementación más compleja, esto podría estar restringido a admins
+        
+        # Obtener la página de usuarios activos sin contar la colección
+        # En una implementación con roles, los admins podrían ver todos
+        active_users, has_more = await self.user_model.list_window(
+            skip=skip, limit=limit, only_active=True
+        )
+        
+        return active_users, has_more
+    
+    async def stream(
+        self,
+        requesting_user_id: str,
+        skip: int = 0,
+        limit: int = 20
+    ) -> AsyncIterator[User]:
+        """
+        Igual que execute, pero entrega los usuarios activos uno a uno.
+        Las validaciones se hacen antes de devolver el iterador, para que
+        los errores se respondan como HTTP y no a mitad del stream.
+        
+        Args:
+            requesting_user_id: ID del usuario que hace la petición
+            skip: Número de registros a saltar
+            limit: Límite de registros a retornar
+            
+        Returns:
+            Iterador asíncrono de usuarios activos
             
         Raises:
             ValidationException: Si hay errores de validación
             AuthorizationException: Si no tiene permisos
             UserInactiveException: Si el usuario está inactivo
         """
+        await self._validate_request(requesting_user_id, skip, limit)
+        return self.user_model.iter_page(skip=skip, limit=limit, only_active=True)
+    
+    async def _validate_request(self, requesting_user_id: str, skip: int, limit: int) -> None:
+        """
+        Valida los parámetros de paginación y el usuario solicitante.
+        
+        Args:
+            requesting_user_id: ID del usuario que hace la petición
+            skip: Número de registros a saltar
+            limit: Límite de registros a retornar
+        """
         # Validaciones básicas
         if not requesting_user_id or not requesting_user_id.strip():
             raise ValidationException("Requesting user ID es requerido", "requesting_user_id")
@@ -60,21 +109,7 @@ class ListUsersUseCase:
         
         if not requesting_user.is_active:
             raise UserInactiveException(requesting_user_id)
-        
-        # Por ahora, cualquier usuario autenticado puede listar usuarios
-        # En una implementación más compleja, esto podría estar restringido a admins
-        
-        # Obtener usuarios
-        users = await self.user_model.get_all(skip=skip, limit=limit)
-        
-        # Filtrar solo usuarios activos (para usuarios normales)
-        # En una implementación con roles, los admins podrían ver todos
-        active_users = [user for user in users if user.is_active]
-        
-        # Obtener total de usuarios activos usando la función optimizada
-        total_users = await self._count_active_users()
-        
-        return active_users, total_users
+
     
     async def execute_by_admin(
         self, 
@@ -102,26 +137,12 @@ class ListUsersUseCase:
         if limit < 1 or limit > 100:
             raise ValidationException("Limit debe estar entre 1 y 100", "limit")
         
-        # Obtener todos los usuarios
-        all_users = await self.user_model.get_all(skip=skip, limit=limit)
-        
-        if include_inactive:
-            users = all_users
-            total = await self.user_model.count()
-        else:
-            users = [user for user in all_users if user.is_active]
-            total = await self._count_active_users()
+        # Obtener la página y el total en una sola consulta
+        users, total = await self.user_model.list_with_total(
+            skip=skip, limit=limit, only_active=not include_inactive
+        )
         
         return users, total
-    
-    async def _count_active_users(self) -> int:
-        """
-        Cuenta el número de usuarios activos usando la nueva función optimizada.
-        
-        Returns:
-            Número de usuarios activos
-        """
-        return await self.user_model.count_active()
 
 # Instancia del caso de uso
 list_users_use_case = ListUsersUseCase()
\ No newline at end of file
@@ -67,7 +67,7 @@ class LoginUserUseCase:
             raise UserInactiveException(user.id)
         
         # Verificar contraseña
-        is_valid_password = self.password_hasher.verify_password(
+        is_valid_password = await self.password_hasher.verify_password_async(
             password, user.password_hash
         )
         if not is_valid_password:
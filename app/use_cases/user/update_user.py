@@ -85,16 +85,21 @@ class UpdateUserUseCase:
         if not user.is_active:
             raise UserInactiveException(user_id)
         
+        # Campos modificados (solo estos se escriben en la base de datos)
+        changed_fields = []
+        
         # Validar y actualizar email si se proporciona
         if new_email:
             await self._update_user_email(user, new_email)
+            changed_fields.append("email")
         
         # Validar y actualizar contraseña si se proporciona
         if new_password:
             await self._update_user_password(user, new_password)
+            changed_fields.append("password_hash")
         
         # Guardar cambios
-        updated_user = await self.user_model.update(user)
+        updated_user = await self.user_model.update(user, changed_fields)
         
         return updated_user
     
@@ -140,7 +145,7 @@ class UpdateUserUseCase:
             raise ValidationException("La contraseña debe tener entre 6 y 128 caracteres", "password")
         
         # Generar nuevo hash
-        new_password_hash = self.password_hasher.hash_password(new_password)
+        new_password_hash = await self.password_hasher.hash_password_async(new_password)
         
         # Actualizar contraseña en la entidad
         user.update_password_hash(new_password_hash)
@@ -182,13 +187,18 @@ class UpdateUserUseCase:
         if not user:
             raise UserNotFoundException(user_id)
         
+        # Campos modificados (solo estos se escriben en la base de datos)
+        changed_fields = []
+        
         # Actualizar email si se proporciona
         if new_email:
             await self._update_user_email(user, new_email)
+            changed_fields.append("email")
         
         # Actualizar contraseña si se proporciona
         if new_password:
             await self._update_user_password(user, new_password)
+            changed_fields.append("password_hash")
         
         # Actualizar estado activo si se proporciona
         if is_active is not None:
@@ -196,9 +206,10 @@ class UpdateUserUseCase:
                 user.activate()
             else:
                 user.deactivate()
+            changed_fields.append("is_active")
         
         # Guardar cambios
-        updated_user = await self.user_model.update(user)
+        updated_user = await self.user_model.update(user, changed_fields)
         
         return updated_user
 
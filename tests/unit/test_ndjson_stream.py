@@ -0,0 +1,64 @@
+"""
+Tests del export NDJSON: cada usuario debe salir en su propio mensaje
+de cuerpo, también cuando el cliente acepta gzip.
+"""
+import orjson
+import pytest
+from starlette.middleware.gzip import GZipMiddleware
+from app.controllers.user_controller import UserController
+from app.domain.user.user_entity import User
+from app.interfaces.schemas.user_request import UserQueryRequest
+
+
+class FakeListUsersUseCase:
+    def __init__(self, users):
+        self.users = users
+
+    async def stream(self, requesting_user_id, skip=0, limit=20):
+        async def iterate():
+            for user in self.users:
+                yield user
+        return iterate()
+
+
+async def run_through_gzip(response, accept_encoding: bytes) -> list:
+    """Ejecuta la respuesta detrás de GZipMiddleware y devuelve los mensajes ASGI."""
+    messages = []
+
+    async def app(scope, receive, send):
+        await response(scope, receive, send)
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/users/export.ndjson",
+        "headers": [(b"accept-encoding", accept_encoding)],
+    }
+    await GZipMiddleware(app, minimum_size=1024)(scope, receive, send)
+    return messages
+
+
+@pytest.mark.parametrize("accept_encoding", [b"gzip, deflate", b"identity"])
+@pytest.mark.asyncio
+async def test_each_user_is_sent_in_its_own_body_message(accept_encoding):
+    users = [User.create_new_user(f"s{i}@x.com", "hash") for i in range(5)]
+    controller = UserController()
+    controller.list_users_use_case = FakeListUsersUseCase(users)
+
+    response = await controller.stream_users(UserQueryRequest(skip=0, limit=5), users[0])
+    messages = await run_through_gzip(response, accept_encoding)
+
+    start = messages[0]
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"identity"
+
+    bodies = [message["body"] for message in messages[1:] if message["body"]]
+    assert len(bodies) == len(users)
+    assert [orjson.loads(body)["email"] for body in bodies] == [user.email for user in users]
+    assert all(body.endswith(b"\n") for body in bodies)
@@ -0,0 +1,72 @@
+"""
+Tests de contrato: el JSON que emiten /me/profile y /user/{user_id}
+debe validar contra el response_model declarado en cada ruta.
+Los controllers devuelven un Response ya serializado, así que FastAPI
+no valida el cuerpo: estos tests evitan que el esquema OpenAPI se desfase.
+"""
+import orjson
+import pytest
+from app.controllers.user_controller import UserController
+from app.core.cache import profile_response_cache
+from app.domain.user.user_entity import User
+from app.interfaces.api.v1.routes.user_routes import router
+
+
+class FakeGetUserByIdUseCase:
+    def __init__(self, user: User):
+        self.user = user
+
+    async def execute(self, user_id, requesting_user_id):
+        return self.user
+
+    async def execute_own_profile(self, user_id):
+        return self.user
+
+
+@pytest.fixture
+def user():
+    return User.create_new_user("contract@x.com", "hash")
+
+
+@pytest.fixture
+def controller(user):
+    controller = UserController()
+    controller.get_user_by_id_use_case = FakeGetUserByIdUseCase(user)
+    profile_response_cache.pop(user.id)
+    yield controller
+    profile_response_cache.pop(user.id)
+
+
+def declared_model(path: str):
+    route = next(route for route in router.routes if route.path == path and "GET" in route.methods)
+    return route.response_model
+
+
+def assert_matches_model(body: bytes, model) -> None:
+    payload = orjson.loads(body)
+    parsed = model.model_validate_json(body)
+    # Sin campos fuera del esquema declarado, ni en el sobre ni en el usuario
+    assert set(payload) <= set(model.model_fields)
+    assert set(payload["user"]) == set(type(parsed.user).model_fields)
+
+
+@pytest.mark.asyncio
+async def test_profile_body_matches_declared_model(controller, user):
+    model = declared_model("/me/profile")
+
+    first = await controller.get_current_user_profile(user)
+    cached = await controller.get_current_user_profile(user)
+
+    assert_matches_model(first.body, model)
+    assert cached.body == first.body
+    assert model.model_validate_json(first.body).user.id == user.id
+
+
+@pytest.mark.asyncio
+async def test_user_detail_body_matches_declared_model(controller, user):
+    model = declared_model("/user/{user_id}")
+
+    response = await controller.get_user_by_id(user.id, user)
+
+    assert_matches_model(response.body, model)
+    assert model.model_validate_json(response.body).user.email == user.email
@@ -0,0 +1,97 @@
+"""
+Tests de invalidación de la cache de usuarios: una carga que termina después
+de update()/delete() no debe volver a guardar el usuario anterior.
+"""
+import asyncio
+import pytest
+from app.core.cache import TTLCache, current_user_cache
+from app.domain.user.user_entity import User
+from app.infrastructure.db import user_model as user_model_module
+from app.infrastructure.db.user_model import UserModel
+
+
+class BlockingLoader:
+    """Loader falso que devuelve el usuario solo cuando el test lo libera."""
+
+    def __init__(self, user: User):
+        self.user = user
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def load(self, user_id):
+        self.started.set()
+        await self.release.wait()
+        return User.from_dict(self.user.to_dict())
+
+
+class FakeDB:
+    async def update_user(self, user, fields=None):
+        return True
+
+    async def delete_user(self, user_id):
+        return True
+
+
+@pytest.fixture
+def user(monkeypatch):
+    user = User.create_new_user("race@x.com", "hash")
+    loader = BlockingLoader(user)
+    monkeypatch.setattr(user_model_module, "user_loader", loader)
+    current_user_cache.clear()
+    yield user
+    current_user_cache.clear()
+
+
+@pytest.fixture
+def model():
+    model = UserModel()
+    model.db = FakeDB()
+    return model
+
+
+@pytest.mark.parametrize("write", ["update", "delete"])
+@pytest.mark.asyncio
+async def test_load_racing_a_write_does_not_refill_cache(model, user, write):
+    loader = user_model_module.user_loader
+    lookup = asyncio.ensure_future(model.get_by_id(user.id))
+    await loader.started.wait()
+
+    if write == "update":
+        await model.update(user)
+    else:
+        await model.delete(user.id)
+    loader.release.set()
+
+    assert (await lookup).id == user.id
+    assert current_user_cache.get(user.id) is None
+
+
+@pytest.mark.asyncio
+async def test_load_without_writes_fills_cache(model, user):
+    user_model_module.user_loader.release.set()
+
+    await model.get_by_id(user.id)
+
+    assert current_user_cache.get(user.id).id == user.id
+
+
+def test_set_if_unchanged_rejects_values_read_before_invalidation():
+    cache = TTLCache(maxsize=10, ttl=30)
+    generation = cache.generation("a")
+
+    cache.invalidate("a")
+
+    assert cache.set_if_unchanged("a", "stale", generation) is False
+    assert cache.get("a") is None
+    assert cache.set_if_unchanged("a", "fresh", cache.generation("a")) is True
+    assert cache.get("a") == "fresh"
+
+
+def test_invalidation_generations_stay_bounded():
+    cache = TTLCache(maxsize=3, ttl=30)
+
+    for key in range(10):
+        cache.invalidate(key)
+
+    assert len(cache._generations) == 3
+    assert cache.generation(9) != 0
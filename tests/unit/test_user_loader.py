@@ -0,0 +1,98 @@
+"""
+Tests unitarios del cargador de usuarios por ID (UserLoader).
+"""
+import asyncio
+import pytest
+from app.domain.user.user_entity import User
+from app.infrastructure.db.user_loader import UserLoader
+
+
+def make_doc(user_id: str) -> dict:
+    user = User.create_new_user(f"{user_id}@x.com", "hash")
+    user.id = user_id
+    return user.to_dict()
+
+
+class FakeDB:
+    """BD falsa que registra cada consulta $in."""
+
+    def __init__(self, docs, error=None):
+        self.docs = {doc["id"]: doc for doc in docs}
+        self.error = error
+        self.calls = []
+
+    async def get_user_docs_by_ids(self, user_ids):
+        self.calls.append(list(user_ids))
+        if self.error:
+            raise self.error
+        return {user_id: self.docs[user_id] for user_id in user_ids if user_id in self.docs}
+
+
+def make_loader(db: FakeDB) -> UserLoader:
+    loader = UserLoader()
+    loader.db = db
+    return loader
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_share_one_query():
+    db = FakeDB([make_doc("a"), make_doc("b")])
+    loader = make_loader(db)
+
+    user_a, user_b, user_a_again = await asyncio.gather(
+        loader.load("a"), loader.load("b"), loader.load("a")
+    )
+
+    assert db.calls == [["a", "b"]]
+    assert (user_a.id, user_b.id, user_a_again.id) == ("a", "b", "a")
+    # Cada llamada recibe su propia entidad
+    assert user_a is not user_a_again
+
+
+@pytest.mark.asyncio
+async def test_loads_in_different_ticks_use_separate_queries():
+    db = FakeDB([make_doc("a"), make_doc("b")])
+    loader = make_loader(db)
+
+    await loader.load("a")
+    await loader.load("b")
+
+    assert db.calls == [["a"], ["b"]]
+
+
+@pytest.mark.asyncio
+async def test_missing_id_resolves_to_none():
+    db = FakeDB([make_doc("a")])
+    loader = make_loader(db)
+
+    found, missing = await asyncio.gather(loader.load("a"), loader.load("missing"))
+
+    assert found.id == "a"
+    assert missing is None
+
+
+@pytest.mark.asyncio
+async def test_failed_query_propagates_to_every_caller():
+    db = FakeDB([], error=ConnectionError("Database not connected"))
+    loader = make_loader(db)
+
+    results = await asyncio.gather(loader.load("a"), loader.load("b"), return_exceptions=True)
+
+    assert len(db.calls) == 1
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_malformed_document_fails_only_its_id():
+    broken = make_doc("broken")
+    del broken["password_hash"]
+    db = FakeDB([make_doc("a"), broken])
+    loader = make_loader(db)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(loader.load("broken"), loader.load("a"), return_exceptions=True),
+        timeout=1
+    )
+
+    assert isinstance(results[0], KeyError)
+    assert results[1].id == "a"
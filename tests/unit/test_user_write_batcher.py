@@ -0,0 +1,164 @@
+"""
+Tests unitarios del agrupador de inserciones (UserWriteBatcher)
+y del mapeo de errores de MongoClient.create_users_bulk.
+"""
+import asyncio
+import pytest
+from pymongo.errors import BulkWriteError
+from app.core.exceptions import UserAlreadyExistsException
+from app.domain.user.user_entity import User
+from app.infrastructure.db.mongo_client import MongoClient
+from app.infrastructure.db.user_write_batcher import UserWriteBatcher
+
+
+def make_user(email: str) -> User:
+    return User.create_new_user(email, "hash")
+
+
+class FakeDB:
+    """BD falsa: create_user puede bloquearse hasta que el test lo libere."""
+
+    def __init__(self):
+        self.single_calls = []
+        self.bulk_calls = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.bulk_errors = None
+        self.single_error = None
+
+    async def create_user(self, user: User) -> bool:
+        self.single_calls.append(user)
+        await self.release.wait()
+        if self.single_error:
+            raise self.single_error
+        return True
+
+    async def create_users_bulk(self, users):
+        self.bulk_calls.append(list(users))
+        await self.release.wait()
+        return self.bulk_errors or [None] * len(users)
+
+
+@pytest.fixture
+def batcher():
+    batcher = UserWriteBatcher()
+    batcher.db = FakeDB()
+    return batcher
+
+
+async def _start_burst(batcher):
+    """Deja una escritura directa en curso para que las siguientes se agrupen."""
+    batcher.db.release.clear()
+    first = asyncio.ensure_future(batcher.create(make_user("first@x.com")))
+    await asyncio.sleep(0)
+    return first
+
+
+@pytest.mark.asyncio
+async def test_idle_create_writes_directly(batcher):
+    assert await batcher.create(make_user("a@x.com")) is True
+
+    assert len(batcher.db.single_calls) == 1
+    assert batcher.db.bulk_calls == []
+    assert batcher._in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_burst_coalesces_into_one_bulk_write(batcher):
+    first = await _start_burst(batcher)
+    users = [make_user(f"u{i}@x.com") for i in range(3)]
+    batcher.db.bulk_errors = [None, UserAlreadyExistsException(users[1].email), None]
+
+    tasks = [asyncio.ensure_future(batcher.create(user)) for user in users]
+    await asyncio.sleep(0.01)
+    batcher.db.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert await first is True
+    assert batcher.db.bulk_calls == [users]
+    assert results[0] is True and results[2] is True
+    assert isinstance(results[1], UserAlreadyExistsException)
+    assert batcher._in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_single_pending_user_uses_insert_one(batcher):
+    first = await _start_burst(batcher)
+    batcher.db.single_error = UserAlreadyExistsException("dup@x.com")
+
+    task = asyncio.ensure_future(batcher.create(make_user("dup@x.com")))
+    await asyncio.sleep(0.01)
+    batcher.db.release.set()
+
+    with pytest.raises(UserAlreadyExistsException):
+        await task
+    with pytest.raises(UserAlreadyExistsException):
+        await first
+    assert batcher.db.bulk_calls == []
+    assert len(batcher.db.single_calls) == 2
+
+
+@pytest.mark.parametrize("fail", [False, True])
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_break_flush(batcher, fail):
+    loop = asyncio.get_running_loop()
+    loop_errors = []
+    loop.set_exception_handler(lambda _, context: loop_errors.append(context))
+
+    first = await _start_burst(batcher)
+    if fail:
+        batcher.db.single_error = RuntimeError("boom")
+    task = asyncio.ensure_future(batcher.create(make_user("gone@x.com")))
+    await asyncio.sleep(0.01)
+    (flush_task,) = batcher._tasks
+    task.cancel()
+    batcher.db.release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.gather(first, flush_task, return_exceptions=True)
+
+    assert flush_task.exception() is None
+    assert loop_errors == []
+    assert batcher._in_flight == 0
+
+
+class FakeBulkCollection:
+    def __init__(self, write_errors):
+        self.write_errors = write_errors
+
+    async def bulk_write(self, operations, ordered=True):
+        assert ordered is False
+        if self.write_errors:
+            raise BulkWriteError({"writeErrors": self.write_errors})
+
+
+def make_client(write_errors) -> MongoClient:
+    client = MongoClient()
+    client._client = object()
+    client._connected = True
+    client._users_collection = FakeBulkCollection(write_errors)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_create_users_bulk_maps_write_errors_by_index():
+    users = [make_user(f"b{i}@x.com") for i in range(3)]
+    client = make_client([
+        {"index": 0, "code": 11000, "errmsg": "duplicate key"},
+        {"index": 2, "code": 121, "errmsg": "validation failed"},
+    ])
+
+    errors = await client.create_users_bulk(users)
+
+    assert isinstance(errors[0], UserAlreadyExistsException)
+    assert users[0].email in errors[0].message
+    assert errors[1] is None
+    assert isinstance(errors[2], RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_create_users_bulk_without_errors():
+    users = [make_user(f"c{i}@x.com") for i in range(2)]
+
+    assert await make_client([]).create_users_bulk(users) == [None, None]